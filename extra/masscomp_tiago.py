@@ -1,9 +1,20 @@
+import functools
+import heapq
+import operator
+import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
 from src import seqsim
 
-import random
 
-def test_hayneedle(method, num_needles):
+def _needle_dists(needle, hay, method):
+    # compare one needle against the whole hay in a single worker
+    method_fn = seqsim.METHODS[method]
+    return [(word, method_fn(needle, word)) for word in hay]
+
+
+def test_hayneedle(method, num_needles, n_jobs=None):
     # read data from the Unix dictionary
     with open('/usr/share/dict/words') as handler:
         words = [line.strip() for line in handler]
@@ -12,10 +23,18 @@ def test_hayneedle(method, num_needles):
     random.shuffle(words)
     needles, hay = words[:num_needles], words[num_needles:]
 
-    # run
-    dists = seqsim.stringscomp(needles, hay, method=method)
-    for needle in needles:
-        print(method, needle, dists[needle][:3])
+    # scan the hay for all needles in parallel; the scans are independent,
+    # so a process pool sidesteps the GIL for the pure-Python methods
+    worker = functools.partial(_needle_dists, hay=hay, method=method)
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        results = executor.map(worker, needles)
+
+    for needle, dists in zip(needles, results):
+        # only the best few matches are reported, so an O(N log k)
+        # selection beats sorting the whole hay
+        best = heapq.nsmallest(3, dists, key=operator.itemgetter(1))
+        print(method, needle, best)
+
 
 if __name__ == "__main__":
     method = sys.argv[1]
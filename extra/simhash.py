@@ -2,21 +2,39 @@
 # https://github.com/leonsim/simhash/tree/master/tests
 # where it is released under the MIT License
 import re
+import functools
 import hashlib
 import logging
 import numbers
-import collections
+import collections.abc
 from itertools import groupby
 
+import numpy as np
+
 basestring = str
 unicode = str
 long = int
 
 
+# The same sliding-window tokens show up in many different inputs (and
+# repeatedly in the same one), so the md5 round per token is memoized
+@functools.lru_cache(maxsize=None)
 def _hashfunc(x):
     return int(hashlib.md5(x).hexdigest(), 16)
 
 
+@functools.lru_cache(maxsize=None)
+def simhash_value(text, f=64):
+    """
+    Return the integer fingerprint of `text`, memoized per process.
+
+    Drivers that fingerprint the same word across repeated calls (such as
+    needle/hay comparisons over a dictionary) can use this instead of
+    constructing a `Simhash` per word.
+    """
+    return Simhash(text, f=f).value
+
+
 class Simhash(object):
 
     def __init__(
@@ -52,7 +70,7 @@ class Simhash(object):
             self.value = value.value
         elif isinstance(value, basestring):
             self.build_by_text(unicode(value))
-        elif isinstance(value, collections.Iterable):
+        elif isinstance(value, collections.abc.Iterable):
             self.build_by_features(value)
         elif isinstance(value, numbers.Integral):
             self.value = value
@@ -87,34 +105,40 @@ class Simhash(object):
                    will be assumed), a list of (token, weight) tuples or
                    a token -> weight dict.
         """
-        v = [0] * self.f
-        masks = [1 << i for i in range(self.f)]
         if isinstance(features, dict):
             features = features.items()
+
+        # Accumulate the +-weight counters for all bit lanes at once: each
+        # hash is unpacked into its `f` low bits and the lanes updated with
+        # a single vector operation, instead of one Python loop per bit.
+        mask = (1 << self.f) - 1
+        nbytes = (self.f + 7) // 8
+        v = np.zeros(self.f, dtype=np.int64)
         for f in features:
             if isinstance(f, basestring):
                 h = self.hashfunc(f.encode('utf-8'))
                 w = 1
             else:
-                assert isinstance(f, collections.Iterable)
+                assert isinstance(f, collections.abc.Iterable)
                 h = self.hashfunc(f[0].encode('utf-8'))
                 w = f[1]
-            for i in range(self.f):
-                v[i] += w if h & masks[i] else -w
-        ans = 0
-        for i in range(self.f):
-            if v[i] > 0:
-                ans |= masks[i]
-        self.value = ans
+            bits = np.unpackbits(
+                np.frombuffer((h & mask).to_bytes(nbytes, 'little'), dtype=np.uint8),
+                bitorder='little',
+            )[:self.f]
+            v += w * (2 * bits.astype(np.int64) - 1)
+
+        # Collapse the counters back into the fingerprint: bit i is set
+        # whenever lane i ended up positive
+        ans_bytes = np.packbits(v > 0, bitorder='little').tobytes()
+        self.value = int.from_bytes(ans_bytes, 'little')
 
     def distance(self, another):
         assert self.f == another.f
         x = (self.value ^ another.value) & ((1 << self.f) - 1)
-        ans = 0
-        while x:
-            ans += 1
-            x &= x - 1
-        return ans
+        # `bin().count()` runs the popcount in C instead of clearing one
+        # set bit per Python-level iteration
+        return bin(x).count('1')
 
 
 class SimhashIndex(object):
@@ -16,8 +16,14 @@ __email__ = "tiago.tresoldi@lingfil.uu.se"
 __version__ = "0.3.1"
 
 # Import Python standard libraries
-from typing import Hashable, Sequence
+from typing import Hashable, List, Optional, Sequence, Tuple
+import concurrent.futures
 import itertools
+import math
+import os
+
+# Import 3rd-party libraries
+import numpy as np
 
 # Import local modules
 from . import edit
@@ -101,27 +107,267 @@ def distance(
     if len(seqs) < 2:
         raise ValueError("At least two sequences are need for computation.")
 
-    # Make sure the requested method is available
-    if method not in METHODS:
+    # Make sure the requested method is available, resolving it with a
+    # single dictionary lookup shared by all the pairwise calls below
+    method_fn = METHODS.get(method)
+    if method_fn is None:
         raise ValueError(f"Unknown or unsupported method `{method}.")
 
     # While we could use a combination also for two sequences, it takes a little
     # less code to check and do it directly, and it will make easier to
     # implement methods different than the mean in the future.
     if len(seqs) == 2:
-        dist = METHODS[method](seqs[0], seqs[1], normal=normal)
+        dist = method_fn(seqs[0], seqs[1], normal=normal)
     else:
-        dists = [
-            METHODS[method](seq_x, seq_y, normal=normal)
-            for seq_x, seq_y in itertools.combinations(seqs, 2)
-        ]
-        dist = sum(dists) / len(seqs)
+        # Accumulate the pairwise scores as we go instead of materializing
+        # an intermediate list with one entry per combination
+        total = 0.0
+        for seq_x, seq_y in itertools.combinations(seqs, 2):
+            total += method_fn(seq_x, seq_y, normal=normal)
+        dist = total / len(seqs)
 
     return dist
 
 
+def distance_matrix(
+    seqs: Sequence[Sequence[Hashable]],
+    method: str = "levenshtein",
+    normal: bool = False,
+    threshold: Optional[float] = None,
+    workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Computes the matrix of pairwise distances according to a specified method.
+
+    The stemmatological use cases of the package usually involve comparing
+    every pair of a corpus of sequences, and this function is the single
+    point of call for that workload. Each unordered pair is evaluated only
+    once (in corpus order) and mirrored into both halves of the matrix, so
+    the number of calls to the underlying method is halved with respect to
+    a naive double loop. Methods with a dedicated batch implementation,
+    such as the Jaccard distance, are dispatched to it.
+
+    When `threshold` is given, only the scores up to it are guaranteed to
+    be exact: a handful of pivot sequences is compared against the whole
+    corpus first, and any pair whose distance to the pivots already
+    proves it farther apart than the threshold (by the triangle
+    inequality) is recorded as `threshold` + 1 without being evaluated.
+    This is only sound for methods that are proper distances, as
+    discussed in the module docstring; for the similarity measures the
+    caller should leave `threshold` unset.
+
+    Examples
+    *********
+
+    .. code-block:: python
+
+        >>> seqsim.distance_matrix(["abc", "bcde", "fgh"])
+        array([[0., 3., 3.],
+               [3., 0., 4.],
+               [3., 4., 0.]])
+
+    :param seqs: A group of group of hashable elements to be compared.
+    :param method: The method for comparison to be used. The list of
+        methods, and the function they call, can be obtained from the
+        keys of the `METHODS` dictionary exported by this module.
+        Defaults to "levenshtein".
+    :param normal: Whether to return normalized scores for the comparisons
+        in range [0..1], as in the `distance` function. Defaults to `False`.
+    :param threshold: An optional largest distance of interest; when
+        provided, pairs that can be proven farther apart than it are
+        skipped and reported as `threshold` + 1. Defaults to `None`
+        (exact matrix).
+    :param workers: An optional number of worker processes for
+        evaluating the pairs in parallel (-1 for one per CPU). The
+        pairwise comparisons are independent, so on large corpora the
+        speedup is close to linear in the number of cores; for small
+        corpora the pool startup dominates and the default serial path
+        is faster. Ignored when `threshold` is set, as the pruned
+        construction is sequential by nature. Defaults to `None`
+        (serial evaluation).
+    :return: A square matrix with the score between each pair of
+        sequences and zeros in the diagonal.
+    """
+
+    # Make sure the requested method is available, resolving it with a
+    # single dictionary lookup shared by all the pairwise calls below
+    method_fn = METHODS.get(method)
+    if method_fn is None:
+        raise ValueError(f"Unknown or unsupported method `{method}.")
+
+    if threshold is not None:
+        return _distance_matrix_pruned(seqs, method, normal, threshold)
+
+    # Dispatch to the dedicated batch implementation when one exists
+    if method == "jaccard":
+        return token.jaccard_matrix(seqs)
+
+    if workers is not None:
+        return _distance_matrix_parallel(seqs, method, normal, workers)
+
+    # Evaluate the upper triangle and mirror it; note that this makes the
+    # matrix symmetric by construction even for methods that are not
+    # perfectly symmetric themselves (such as "mmcwpa")
+    matrix = np.zeros((len(seqs), len(seqs)))
+    for idx_x, idx_y in itertools.combinations(range(len(seqs)), 2):
+        score = method_fn(seqs[idx_x], seqs[idx_y], normal=normal)
+        matrix[idx_x, idx_y] = score
+        matrix[idx_y, idx_x] = score
+
+    return matrix
+
+
+def _score_pairs(
+    method: str,
+    pairs: List[Tuple[Sequence[Hashable], Sequence[Hashable]]],
+    normal: bool,
+) -> List[float]:
+    """
+    Computes the scores for a chunk of sequence pairs.
+
+    This is the unit of work shipped to the worker processes by
+    `_distance_matrix_parallel()`; it must be a module-level function so
+    it can be pickled for the pool.
+
+    :param method: The method for comparison to be used.
+    :param pairs: The sequence pairs to be compared.
+    :param normal: Whether to return normalized scores for the comparisons.
+    :return: The scores, in the order of the pairs.
+    """
+
+    method_fn = METHODS[method]
+
+    return [method_fn(seq_x, seq_y, normal=normal) for seq_x, seq_y in pairs]
+
+
+def _distance_matrix_parallel(
+    seqs: Sequence[Sequence[Hashable]],
+    method: str,
+    normal: bool,
+    workers: int,
+) -> np.ndarray:
+    """
+    Computes a pairwise distance matrix over a pool of worker processes.
+
+    The comparisons are embarrassingly parallel, so the upper triangle
+    is split into a few chunks per worker (large enough to amortize the
+    pickling of the sequences, small enough to balance the load) and
+    evaluated with a `ProcessPoolExecutor`; processes rather than
+    threads, as the scorers are pure Python and hold the GIL.
+
+    :param seqs: A group of group of hashable elements to be compared.
+    :param method: The method for comparison to be used.
+    :param normal: Whether to return normalized scores for the comparisons.
+    :param workers: The number of worker processes (-1 for one per CPU).
+    :return: A square matrix with the score between each pair of
+        sequences and zeros in the diagonal.
+    """
+
+    if workers < 1:
+        workers = os.cpu_count() or 1
+
+    pair_indices = list(itertools.combinations(range(len(seqs)), 2))
+    matrix = np.zeros((len(seqs), len(seqs)))
+    if not pair_indices:
+        return matrix
+
+    chunk_size = max(1, len(pair_indices) // (workers * 4))
+    chunks = [
+        pair_indices[start : start + chunk_size]
+        for start in range(0, len(pair_indices), chunk_size)
+    ]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _score_pairs,
+                method,
+                [(seqs[idx_x], seqs[idx_y]) for idx_x, idx_y in chunk],
+                normal,
+            )
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            for (idx_x, idx_y), score in zip(chunk, future.result()):
+                matrix[idx_x, idx_y] = matrix[idx_y, idx_x] = score
+
+    return matrix
+
+
+def _distance_matrix_pruned(
+    seqs: Sequence[Sequence[Hashable]],
+    method: str,
+    normal: bool,
+    threshold: float,
+) -> np.ndarray:
+    """
+    Computes a pairwise distance matrix with triangle-inequality pruning.
+
+    About log2(N) sequences are taken as pivots and compared against the
+    whole corpus; for every remaining pair (x, y), the triangle
+    inequality gives `|d(x, p) - d(p, y)| <= d(x, y)` for each pivot
+    `p`, so whenever that lower bound already exceeds the threshold the
+    pair is marked as `threshold` + 1 without calling the method. With
+    many near-duplicates, as is common in stemmatological corpora, most
+    of the quadratic work is skipped. For the plain Levenshtein
+    distance, the surviving calls are further handed the threshold as
+    `max_distance`, so the banded kernel can saturate early too.
+
+    :param seqs: A group of group of hashable elements to be compared.
+    :param method: The method for comparison to be used.
+    :param normal: Whether to return normalized scores for the comparisons.
+    :param threshold: The largest distance of interest.
+    :return: A square matrix with the score between each pair of
+        sequences, `threshold` + 1 for the pruned pairs, and zeros in
+        the diagonal.
+    """
+
+    method_fn = METHODS[method]
+    num_seqs = len(seqs)
+    matrix = np.zeros((num_seqs, num_seqs))
+    known = np.eye(num_seqs, dtype=bool)
+
+    # The banded Levenshtein kernel can saturate at the threshold, which
+    # keeps the surviving calls cheap as well (only for non-normalized
+    # scores, as `max_distance` is expressed in edit operations)
+    if method == "levenshtein" and not normal:
+
+        def pair_fn(seq_x, seq_y):
+            return method_fn(seq_x, seq_y, max_distance=int(threshold))
+
+    else:
+
+        def pair_fn(seq_x, seq_y):
+            return method_fn(seq_x, seq_y, normal=normal)
+
+    # Compare the pivots against the whole corpus; the pivot rows must be
+    # exact for the bounds below to hold, so the generic method is used
+    pivots = range(min(num_seqs, max(1, int(math.log2(num_seqs or 1)))))
+    for pivot in pivots:
+        for idx in range(num_seqs):
+            if not known[pivot, idx]:
+                score = method_fn(seqs[pivot], seqs[idx], normal=normal)
+                matrix[pivot, idx] = matrix[idx, pivot] = score
+                known[pivot, idx] = known[idx, pivot] = True
+
+    # Evaluate the surviving pairs, pruning those whose pivot-based lower
+    # bound already exceeds the threshold
+    for idx_x, idx_y in itertools.combinations(range(num_seqs), 2):
+        if known[idx_x, idx_y]:
+            continue
+        bound = max(abs(matrix[pivot, idx_x] - matrix[pivot, idx_y]) for pivot in pivots)
+        if bound > threshold:
+            score = threshold + 1
+        else:
+            score = pair_fn(seqs[idx_x], seqs[idx_y])
+        matrix[idx_x, idx_y] = matrix[idx_y, idx_x] = score
+
+    return matrix
+
+
 # Build namespace
 __all__ = [
     "distance",
+    "distance_matrix",
     "METHODS",
 ]
@@ -8,10 +8,39 @@ book-keeping functions such as for interfacing with the system.
 """
 
 # Import Python standard libraries
-from typing import Callable, Hashable, List, Optional, Sequence, Tuple, Union
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+import functools
 import string
 import unicodedata
 
+# Import 3rd-party libraries
+import numpy as np
+
+# Symbols used by `equivalent_string()` for small alphabets: the ASCII
+# printable characters in their usual order, but without the trailing
+# whitespace of `string.printable`, which would skew frequency-based
+# methods (e.g. compression distances) and hinder visual inspection
+_ASCII_SYMBOLS = [char for char in string.printable if not char.isspace()]
+
+
+def collect_subseqs_iter(sequence: Sequence):
+    """
+    Iterate over all possible sub-sequences in a given sequence.
+
+    Sub-sequences are yielded by increasing length and, within the same
+    length, by starting index, each one exactly once. This is the lazy
+    counterpart of `collect_subseqs()`, intended for consumers that only
+    scan the collection once and do not need the sorted materialization.
+
+    :param sequence: The sequence whose sub-sequences shall be iterated over.
+    """
+
+    length = len(sequence)
+    for sub_len in range(1, length + 1):
+        for idx in range(length - sub_len + 1):
+            yield sequence[idx : idx + sub_len]
+
+
 # TODO: replace with the ngram collector module
 def collect_subseqs(sequence: Sequence, sort: bool = True) -> List[Sequence]:
     """
@@ -39,31 +68,8 @@ def collect_subseqs(sequence: Sequence, sort: bool = True) -> List[Sequence]:
     :return: A list of all ngrams of the input sequence.
     """
 
-    # Cache the length of the sequence
-    length = len(sequence)
-
-    # Set the starting index
-    idx = 0
-
-    # define the output list
-    ret = []
-
-    # start the while loop
-    while idx != length and idx < length:
-        # copy the sequence
-        new_sequence = sequence[idx:length]
-
-        # append the sequence to the output list
-        ret += [new_sequence]
-
-        # loop over the new sequence
-        for j in range(1, len(new_sequence)):
-            ret += [new_sequence[:j]]
-            ret += [new_sequence[j:]]
-
-        # increment idx and decrement length
-        idx += 1
-        length -= 1
+    # Enumerate every contiguous sub-sequence, each one exactly once
+    ret = list(collect_subseqs_iter(sequence))
 
     if sort:
         # We try to sort normally; if there is a TypeError, such as when the list has mixed
@@ -72,7 +78,13 @@ def collect_subseqs(sequence: Sequence, sort: bool = True) -> List[Sequence]:
         try:
             ret = sorted(ret, key=lambda e: (len(e), e))
         except TypeError:
-            ret = sorted(ret, key=lambda e: (len(str(e)), str(e)))
+            # Decorate-sort-undecorate, so the string representation is
+            # built exactly once per sub-sequence (the lambda above would
+            # call `str()` twice per element) and the sort itself runs
+            # without any key-function dispatch
+            decorated = [(len(s), s, idx) for idx, s in enumerate(map(str, ret))]
+            decorated.sort()
+            ret = [ret[idx] for _, _, idx in decorated]
 
     return ret
 
@@ -131,15 +143,35 @@ def equivalent_string(
     if isinstance(seq_x, str) and isinstance(seq_y, str):
         return seq_x, seq_y
 
-    # Map the sequences to lists and get the set of symbols
-    # that are used (the list is sorted for reproducibility)
-    seq_x = [element for element in seq_x]
-    seq_y = [element for element in seq_y]
-    elements = sorted(set(seq_x + seq_y), key=lambda e: str(e))
+    # Normalize to hashable tuples, so that repeated pairs (as common in
+    # pairwise comparisons over a corpus) hit the per-process cache
+    return _equivalent_string_cached(tuple(seq_x), tuple(seq_y))
+
+
+@functools.lru_cache(maxsize=1024)
+def _equivalent_string_cached(
+    seq_x: Tuple[Hashable, ...], seq_y: Tuple[Hashable, ...]
+) -> Tuple[str, str]:
+    """
+    Internal cached worker for `equivalent_string()`.
+
+    :param seq_x: The first sequence to be mapped, as a hashable tuple.
+    :param seq_y: The second sequence to be mapped, as a hashable tuple.
+    :return: A tuple of two equivalent strings.
+    """
+
+    # Collect the set of symbols that are used with a single pass over
+    # each sequence, without concatenating them into an intermediate
+    # list; the set is sorted for reproducibility, passing `str` itself
+    # as the key so that it is computed once per unique element with no
+    # lambda dispatch in between
+    unique = set(seq_x)
+    unique.update(seq_y)
+    elements = sorted(unique, key=str)
 
     # Use ASCII printable elements if possible
-    if len(elements) <= len(string.printable):
-        mapper = {source: target for source, target in zip(elements, string.printable)}
+    if len(elements) <= len(_ASCII_SYMBOLS):
+        mapper = {source: target for source, target in zip(elements, _ASCII_SYMBOLS)}
     else:
         # Collect as many "printable" Unicode chars as possible/necessary; we
         # accept "Ll" (Letter, Lowercase), "Lu" (Letter, Uppercase), "Nd" (Number, Decimal Digit),
@@ -162,11 +194,21 @@ def equivalent_string(
 
         mapper = {source: target for source, target in zip(elements, uchars)}
 
-    # Map the new sequences with string elements and return
-    new_seq_x = [mapper.get(element) for element in seq_x]
-    new_seq_y = [mapper.get(element) for element in seq_y]
+    # When every element is itself a single character (as when mixing a
+    # string with a tokenized sequence), the mapping can be applied with
+    # `str.translate()`, which walks the strings at C speed instead of
+    # one dict lookup per element in the interpreter
+    if all(isinstance(element, str) and len(element) == 1 for element in elements):
+        table = str.maketrans(mapper)
+        return "".join(seq_x).translate(table), "".join(seq_y).translate(table)
 
-    return "".join(new_seq_x), "".join(new_seq_y)
+    # Map the sequences to their string equivalents and return; the list
+    # comprehensions (rather than generators) let `str.join()` presize
+    # its output buffer
+    return (
+        "".join([mapper[element] for element in seq_x]),
+        "".join([mapper[element] for element in seq_y]),
+    )
 
 
 # TODO: properly rewrite, perhaps using equivalent_string()
@@ -191,15 +233,40 @@ def sequence_find(hay: Sequence, needle: Sequence) -> Optional[int]:
     :return: The starting index of the sub-sequence in the sequence, or `None` if not
              found.
     """
-    # Cache `needle` length and have it as a tuple already
+    # When both arguments are strings, delegate to the C-level search of
+    # the built-in `str.find()`
+    if isinstance(hay, str) and isinstance(needle, str):
+        idx = hay.find(needle)
+        return idx if idx != -1 else None
+
+    # Cache `needle` length; an empty needle matches at the start, as with
+    # the built-in `str.find()`
     len_needle = len(needle)
-    t_needle = tuple(needle)
-
-    # Iterate over all sub-lists (or sub-tuples) of the correct length and check
-    # for matches
-    for i in range(len(hay) - len_needle + 1):
-        if tuple(hay[i : i + len_needle]) == t_needle:
-            return i
+    if not len_needle:
+        return 0
+
+    # Precompute the Knuth-Morris-Pratt failure table for the needle, so
+    # the scan below never re-examines an element of `hay`: instead of
+    # slicing (and allocating) one candidate window per position, matching
+    # is a single pass with O(len(needle)) extra memory
+    fail = [0] * len_needle
+    k = 0
+    for idx in range(1, len_needle):
+        while k and needle[idx] != needle[k]:
+            k = fail[k - 1]
+        if needle[idx] == needle[k]:
+            k += 1
+        fail[idx] = k
+
+    # Scan the hay, falling back along the failure table on mismatches
+    j = 0
+    for i, element in enumerate(hay):
+        while j and element != needle[j]:
+            j = fail[j - 1]
+        if element == needle[j]:
+            j += 1
+            if j == len_needle:
+                return i - len_needle + 1
 
     return None
 
@@ -209,6 +276,16 @@ def _nwise(I, n):
     Iterate through I n at a time, e.g.
         _nwise("abcd", 2) -> ab, bc, cd
     """
+
+    # Numpy arrays get a zero-copy strided view, so each window is a
+    # slice into the original buffer instead of a fresh allocation; the
+    # view raises on windows longer than the array, where the generic
+    # path just yields nothing, so guard to keep both paths agreeing
+    if isinstance(I, np.ndarray):
+        if n <= len(I):
+            yield from np.lib.stride_tricks.sliding_window_view(I, n)
+        return
+
     for i in range(len(I) + 1 - n):
         yield I[i : i + n]
 
@@ -219,6 +296,11 @@ def _indices(L: Sequence[Hashable], element: Hashable) -> list:
         _indices("abcab", "a") -> 0, 3
     """
 
+    # For numpy arrays the whole scan runs as a single vectorized
+    # comparison; for generic sequences, fall back to the Python loop
+    if isinstance(L, np.ndarray):
+        return np.flatnonzero(L == element).tolist()
+
     return [idx for idx, value in enumerate(L) if value == element]
 
 
@@ -257,11 +339,380 @@ def _wagner_fischer(
             d[0][j] = j
 
     # Flood fill the rest of the matrix with values computed using our
-    # cost function
+    # cost function, which returns the already-minimized cell cost
     for j in range(1, n + 1):
         for i in range(1, m + 1):
-            d[i][j] = min(costs_fn(seq_x, seq_y, d, i, j))
+            d[i][j] = costs_fn(seq_x, seq_y, d, i, j)
 
     # Return lower-right element of matrix, which is the minimum cost
     # for transforming s into t
     return d[m][n]
+
+
+def _levenshtein_diagonal(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> int:
+    """
+    Computes the plain Levenshtein distance with anti-diagonal vectorization.
+
+    Cells on the same anti-diagonal of the Wagner-Fischer matrix are
+    mutually independent, so each diagonal can be filled with a handful of
+    vectorized numpy operations: the m*n per-cell interpreter dispatches
+    become O(m+n) array calls. Note that `_levenshtein_myers()` is faster
+    at every size measured, so this kernel is kept as a vectorized
+    reference rather than being on the dispatch path.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The cost distance.
+    """
+
+    # Integer-code the elements, as numpy needs a numeric dtype; only
+    # element equality matters for the result
+    coder: Dict[Hashable, int] = {}
+    x = np.fromiter(
+        (coder.setdefault(element, len(coder)) for element in seq_x),
+        dtype=np.int64,
+        count=len(seq_x),
+    )
+    y = np.fromiter(
+        (coder.setdefault(element, len(coder)) for element in seq_y),
+        dtype=np.int64,
+        count=len(seq_y),
+    )
+
+    m, n = len(x), len(y)
+    d = np.zeros((m + 1, n + 1), dtype=np.int64)
+    d[:, 0] = np.arange(m + 1)
+    d[0, :] = np.arange(n + 1)
+    for k in range(2, m + n + 1):
+        i = np.arange(max(1, k - n), min(m, k - 1) + 1)
+        j = k - i
+        sub = d[i - 1, j - 1] + (x[i - 1] != y[j - 1])
+        ins = d[i, j - 1] + 1
+        dele = d[i - 1, j] + 1
+        d[i, j] = np.minimum(np.minimum(sub, ins), dele)
+
+    return int(d[m, n])
+
+
+class _RowWindow:
+    """
+    Matrix-like view over the most recent rows of a Wagner-Fischer fill.
+
+    The view is indexed with absolute row numbers, exactly like the full
+    matrix that `_wagner_fischer()` hands to the cost functions, but only
+    the rows still reachable by the cost recurrence are kept alive, so
+    the cost functions work unchanged against either representation.
+    """
+
+    __slots__ = ("_rows", "_base", "_lookback")
+
+    def __init__(self, lookback: int):
+        self._rows: List[List[float]] = []
+        self._base = 0
+        self._lookback = lookback
+
+    def __getitem__(self, idx: int) -> List[float]:
+        return self._rows[idx - self._base]
+
+    def _push(self, row: List[float]) -> None:
+        self._rows.append(row)
+        if len(self._rows) > self._lookback + 1:
+            del self._rows[0]
+            self._base += 1
+
+
+def _wagner_fischer_windowed(
+    seq_x: Sequence[Hashable],
+    seq_y: Sequence[Hashable],
+    costs_fn: Callable,
+    first_column: Sequence[float],
+    lookback: int,
+) -> float:
+    """
+    Computes edit distances keeping only the last `lookback` + 1 rows.
+
+    This is the space-linear counterpart of `_wagner_fischer()` for cost
+    functions whose recurrence reaches at most `lookback` rows up in the
+    matrix (one for plain Levenshtein costs, `max_del_len` for the bulk
+    deletion ones, and so on). Instead of a prebuilt starting matrix,
+    the caller provides only its first column, that is, the cost of
+    deleting the first `i` elements of `seq_x`; the first row is always
+    the plain insertion count. The fill proceeds row by row, so the
+    working set is a handful of rows regardless of the length of `seq_x`.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :param costs_fn: A cost function, specific to a particular edit distance.
+    :param first_column: The first column of the starting matrix.
+    :param lookback: How many rows above the current one the cost
+        function may consult.
+    :return: The cost distance.
+    """
+
+    n = len(seq_y)
+    window = _RowWindow(lookback)
+
+    first_row: List[float] = list(range(n + 1))
+    first_row[0] = first_column[0]
+    window._push(first_row)
+
+    row = first_row
+    for i in range(1, len(seq_x) + 1):
+        row = [first_column[i]] + [0.0] * n
+        window._push(row)
+        for j in range(1, n + 1):
+            row[j] = costs_fn(seq_x, seq_y, window, i, j)
+
+    return row[n]
+
+
+def _levenshtein_myers(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> int:
+    """
+    Computes the plain Levenshtein distance with Myers' bit-parallel algorithm.
+
+    Following Myers (1999), a whole column of the Wagner-Fischer matrix is
+    packed into the bits of a single integer, and each element of `seq_y`
+    advances the column with a fixed handful of bitwise operations. Python
+    integers are arbitrary-precision, so there is no 64-bit limit on
+    `seq_x`: long columns simply become wider integers, whose bitwise
+    operations still run word-parallel in C.
+
+    See: Myers, Gene (1999). "A fast bit-vector algorithm for approximate
+    string matching based on dynamic programming". Journal of the ACM
+    46 (3): 395-415.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The cost distance.
+    """
+
+    m = len(seq_x)
+    if not m:
+        return len(seq_y)
+
+    # Bitmask per element of the alphabet, marking its positions in `seq_x`
+    peq: Dict[Hashable, int] = {}
+    bit = 1
+    for element in seq_x:
+        peq[element] = peq.get(element, 0) | bit
+        bit <<= 1
+
+    # `full` masks results back to m bits, emulating the fixed-width
+    # machine words of the original formulation
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full  # positive vertical deltas
+    mv = 0  # negative vertical deltas
+    score = m
+    for element in seq_y:
+        eq = peq.get(element, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        pv = (mh << 1) | (~(xv | ph) & full)
+        mv = ph & xv
+
+    return score
+
+
+def _is_identical(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> bool:
+    """
+    Checks whether two sequences are equal, accepting numpy arrays.
+
+    The identity short-circuits of the public methods cannot use a bare
+    `==` comparison, as numpy arrays compare elementwise and refuse to
+    collapse to a single truth value; for them, equality is delegated to
+    `np.array_equal()`, which also settles the mixed array/sequence case.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: Whether the two sequences are equal.
+    """
+
+    if seq_x is seq_y:
+        return True
+
+    if isinstance(seq_x, np.ndarray) or isinstance(seq_y, np.ndarray):
+        return bool(np.array_equal(seq_x, seq_y))
+
+    return seq_x == seq_y
+
+
+def _trim_common(
+    seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]
+) -> Tuple[Sequence[Hashable], Sequence[Hashable]]:
+    """
+    Strips the common prefix and suffix from a pair of sequences.
+
+    The shared ends contribute nothing to translation-invariant edit
+    distances (plain Levenshtein and Damerau-Levenshtein), so the
+    kernels only need to compare the differing middles; on
+    near-duplicate material this removes most of the quadratic work.
+    Note that it must *not* be applied to the position-dependent
+    measures (fragile ends, stemmatological, bulk delete), whose costs
+    change with the absolute indices.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The two sequences with shared prefix and suffix removed.
+    """
+
+    lo = 0
+    hi_x, hi_y = len(seq_x), len(seq_y)
+    limit = min(hi_x, hi_y)
+    while lo < limit and seq_x[lo] == seq_y[lo]:
+        lo += 1
+    while hi_x > lo and hi_y > lo and seq_x[hi_x - 1] == seq_y[hi_y - 1]:
+        hi_x -= 1
+        hi_y -= 1
+
+    if lo or hi_x < len(seq_x):
+        return seq_x[lo:hi_x], seq_y[lo:hi_y]
+
+    return seq_x, seq_y
+
+
+def _levenshtein_bounded(
+    seq_x: Sequence[Hashable], seq_y: Sequence[Hashable], max_distance: int
+) -> int:
+    """
+    Computes the Levenshtein distance within a diagonal band (Ukkonen).
+
+    Only the cells within `max_distance` of the main diagonal are ever
+    filled, as any path leaving the band costs more than `max_distance`;
+    the work drops from O(mn) to O(max_distance * min(m, n)). All cell
+    values are additionally capped at `max_distance` + 1, and the fill
+    stops as soon as a whole row saturates.
+
+    See: Ukkonen, Esko (1985). "Algorithms for approximate string
+    matching". Information and Control 64 (1-3): 100-118.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :param max_distance: The largest distance of interest.
+    :return: The exact distance, when it does not exceed `max_distance`,
+        or `max_distance` + 1 otherwise.
+    """
+
+    # Shared ends contribute nothing to the distance
+    seq_x, seq_y = _trim_common(seq_x, seq_y)
+
+    m = len(seq_x)
+    n = len(seq_y)
+    cap = max_distance + 1
+
+    # The length difference is a lower bound for the distance
+    if abs(m - n) > max_distance:
+        return cap
+
+    prev = [min(j, cap) for j in range(n + 1)]
+    for i, elem_x in enumerate(seq_x, 1):
+        lo = max(1, i - max_distance)
+        hi = min(n, i + max_distance)
+        curr = [cap] * (n + 1)
+        curr[0] = min(i, cap)
+        row_min = curr[0] if lo == 1 else cap
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (elem_x != seq_y[j - 1])  # substitution
+            deletion = prev[j] + 1
+            if deletion < cost:
+                cost = deletion
+            insertion = curr[j - 1] + 1
+            if insertion < cost:
+                cost = insertion
+            if cost > cap:
+                cost = cap
+            curr[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min >= cap:
+            return cap
+        prev = curr
+
+    return prev[n]
+
+
+def _levenshtein_core(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> int:
+    """
+    Computes the plain Levenshtein distance for the default costs.
+
+    This is the entry point used by the public Levenshtein functions; it
+    currently delegates to the bit-parallel `_levenshtein_myers()` kernel,
+    which outperformed both the rolling-row and the anti-diagonal numpy
+    fills at every sequence length measured, packing the shorter sequence
+    into the bit columns so the integers stay as narrow as possible.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The cost distance.
+    """
+
+    # Shared ends contribute nothing to the distance
+    seq_x, seq_y = _trim_common(seq_x, seq_y)
+
+    # Pack the shorter sequence into the columns (the distance is
+    # symmetric), keeping the per-step integers narrow
+    if len(seq_x) > len(seq_y):
+        seq_x, seq_y = seq_y, seq_x
+
+    return _levenshtein_myers(seq_x, seq_y)
+
+
+def _levdamerau_core(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> int:
+    """
+    Computes the Damerau-Levenshtein distance with a three-row rolling buffer.
+
+    This is the counterpart of `_levenshtein_core()` for the default
+    Damerau-Levenshtein costs: the transposition term additionally
+    consults the row before the previous one, so three rolling rows are
+    kept instead of two, still avoiding the full matrix and the
+    per-cell cost-function dispatch.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The cost distance.
+    """
+
+    # Shared ends contribute nothing to the distance (this is safe for
+    # the transposition term too, as a transposition never straddles the
+    # boundary of an equal block)
+    seq_x, seq_y = _trim_common(seq_x, seq_y)
+
+    # Iterate over the longer sequence, so the rows held in memory are
+    # the shorter ones (the distance is symmetric)
+    if len(seq_x) < len(seq_y):
+        seq_x, seq_y = seq_y, seq_x
+    n = len(seq_y)
+
+    prev2: List[int] = []
+    prev = list(range(n + 1))
+    for i, elem_x in enumerate(seq_x, 1):
+        curr = [i] + [0] * n
+        for j, elem_y in enumerate(seq_y, 1):
+            cost = prev[j - 1] + (elem_x != elem_y)  # substitution
+            deletion = prev[j] + 1
+            if deletion < cost:
+                cost = deletion
+            insertion = curr[j - 1] + 1
+            if insertion < cost:
+                cost = insertion
+            if (
+                i > 1
+                and j > 1
+                and elem_x == seq_y[j - 2]
+                and seq_x[i - 2] == elem_y
+            ):
+                transposition = prev2[j - 2] + 1
+                if transposition < cost:
+                    cost = transposition
+            curr[j] = cost
+        prev2 = prev
+        prev = curr
+
+    return prev[n]
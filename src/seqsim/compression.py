@@ -7,6 +7,7 @@ to make sure we can operate on arbitrary iterable data structures.
 """
 
 # Import Python standard libraries
+from collections import Counter
 from typing import Hashable, Sequence
 import logging
 
@@ -16,6 +17,79 @@ import textdistance
 # Import other modules
 from . import common
 
+
+def _arith_coding_size(data: str) -> int:
+    """
+    Computes the size in bits of the arithmetic coding of a string.
+
+    The coder follows the classic description in MacKay (2003): each symbol
+    is assigned a sub-interval of the unit interval proportional to its
+    frequency in `data` itself, the whole string narrows the interval step
+    by step, and the result is the binary fraction with the smallest
+    denominator falling inside the final range. All computations are
+    carried out with exact (arbitrary-precision) integer arithmetic, so
+    the reported sizes are stable across platforms and library versions.
+
+    All intermediate intervals share the denominator `len(data) ** k`
+    after `k` coded symbols, so only the integer numerators are tracked;
+    this avoids the gcd normalization that `fractions.Fraction` would
+    perform on every interval update.
+
+    :param data: The string to be coded.
+    :return: The size in bits of the coded string.
+    """
+
+    if not data:
+        return 0
+
+    # Assign each symbol its cumulative interval, as integer counts over
+    # `total`; the most frequent symbols come first, with ties broken by
+    # the symbols themselves so that the coding is deterministic
+    total = len(data)
+    probs = {}
+    cumulative = 0
+    for char, count in sorted(
+        Counter(data).items(), key=lambda item: (item[1], item[0]), reverse=True
+    ):
+        probs[char] = (cumulative, count)
+        cumulative += count
+
+    # Narrow the unit interval down to the range coding the whole string:
+    # after each step the interval is [start, start + width) / total**k
+    start = 0
+    width = 1
+    for char in data:
+        char_start, char_width = probs[char]
+        start = start * total + char_start * width
+        width *= char_width
+
+    # Find the binary fraction numerator/(2**bits) with the smallest
+    # denominator inside the final range; its numerator carries all the
+    # information of the coding. The comparisons cross-multiply with the
+    # interval denominator, so everything stays integral
+    denom = total ** len(data)
+    end = start + width
+    numerator = 0
+    cand_denominator = 1
+    next_denominator = 1
+    while not start * cand_denominator <= numerator * denom < end * cand_denominator:
+        cand_denominator = next_denominator
+        numerator = 1 + (start * cand_denominator) // denom
+        next_denominator *= 2
+
+    if not numerator:
+        return 0
+
+    # Reduce the fraction: the denominator is a power of two, so only
+    # factors of two are shared with the numerator
+    if cand_denominator > 1:
+        shared = numerator & -numerator  # largest power of two dividing it
+        numerator //= min(shared, cand_denominator)
+
+    # The size is ceil(log2(numerator)), computed exactly on the integer
+    return (numerator - 1).bit_length()
+
+
 # TODO: multiple sequences?
 # TODO: consider splitting in similarity/distance
 # TODO: have a normalization method based on seq_x*2 and seq_y*2
@@ -51,7 +125,19 @@ def arith_ncd(
     if normal:
         logging.warning("Arithmetic Coding NCD cannot be normalized in range [0..1].")
 
-    return textdistance.arith_ncd(seq_x, seq_y)
+    # Compute the normalized compression distance from the coded sizes of
+    # the individual strings and of their cheapest concatenation
+    size_x = _arith_coding_size(seq_x)
+    size_y = _arith_coding_size(seq_y)
+    size_concat = min(
+        _arith_coding_size(seq_x + seq_y), _arith_coding_size(seq_y + seq_x)
+    )
+
+    max_size = max(size_x, size_y)
+    if max_size == 0:
+        return 0.0
+
+    return (size_concat - min(size_x, size_y)) / max_size
 
 
 # TODO: multiple sequences?
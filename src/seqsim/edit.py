@@ -7,15 +7,32 @@ iterable data structures.
 """
 
 # Import Python standard libraries
-from typing import Callable, Hashable, List, Sequence, Tuple
+from collections import deque
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
 import difflib
+import functools
 import logging
 
 # Import 3rd-party libraries
 import textdistance
 
 # Import local modules
-from .common import sequence_find, _nwise, _indices, _wagner_fischer
+from .common import (
+    equivalent_string,
+    sequence_find,
+    _is_identical,
+    _nwise,
+    _indices,
+    _levenshtein_bounded,
+    _levdamerau_core,
+    _levenshtein_core,
+)
+
+# Shared scorer instances for the Jaro and Jaro-Winkler methods; the
+# textdistance objects are stateless, so a single one of each can serve
+# every call instead of being rebuilt per comparison
+_JARO = textdistance.JaroWinkler(winklerize=False, external=False)
+_JARO_WINKLER = textdistance.JaroWinkler(winklerize=True, external=False)
 
 # Methods for sequence similarity
 # -------------------------------
@@ -65,7 +82,7 @@ def birnbaum_simil(
     """
 
     # If the sequences are equal, we can just compute the score from length
-    if seq_x == seq_y:
+    if _is_identical(seq_x, seq_y):
         length = len(seq_x)
         return (length * (length + 1)) // 2
 
@@ -73,21 +90,25 @@ def birnbaum_simil(
     if len(seq_x) < len(seq_y):
         seq_x, seq_y = seq_y, seq_x
 
-    # Get the opcodes from `SequenceMatcher` and drop the last one (a dummy)
-    sm = difflib.SequenceMatcher(None, seq_x, seq_y)
-    blocks = sm.get_matching_blocks()[:-1]
+    # Collect the sizes of the matching blocks with the suffix-automaton
+    # search, which is `difflib`-identical below the length where the
+    # latter's "autojunk" heuristic kicks in (and much faster on
+    # repetitive material); `SequenceMatcher` itself is kept for longer
+    # sequences so established results are preserved
+    if len(seq_y) < 200:
+        sizes = _matching_block_sizes(seq_x, seq_y)
+    else:
+        sm = difflib.SequenceMatcher(None, seq_x, seq_y)
+        sizes = [match.size for match in sm.get_matching_blocks()[:-1]]
 
-    # Sum sizes and return
-    sizes = [match.size for match in blocks]
     similarity = sum([(v * (v + 1)) // 2 for v in sizes])
 
     if normal:
-        return float(similarity) / max(
-            [
-                birnbaum_simil(seq_x, seq_x),
-                birnbaum_simil(seq_y, seq_y),
-            ]
-        )
+        # The self-similarity is known analytically (see the identity
+        # shortcut above), and after the swap `seq_x` is the longer
+        # sequence, so its score is the larger denominator
+        length = len(seq_x)
+        return float(similarity) / ((length * (length + 1)) // 2)
 
     return float(similarity)
 
@@ -102,9 +123,11 @@ def fragile_ends_simil(
     but with deletions in the initial or final 10% of the positions being
     discounted.
 
-    This function will use the standard Wagner-Fischer algorithm with the
-    default costs provided by the internal `_levdamerau_costs()`
-    function. This similarity measure is not used directly in the paper and was a
+    This function will use the internal `_fragile_ends_core()` function,
+    a rolling-buffer specialization of the standard Wagner-Fischer
+    algorithm for the "fragile ends" costs (as provided by the internal
+    `_fragile_ends_costs()` function). This similarity measure is not used
+    directly in the paper and was a
     proof-of-concept while working toward the "Stemmatological distance".
 
     Example
@@ -129,8 +152,11 @@ def fragile_ends_simil(
     :return: The computed "fragile ends" similarity.
     """
 
-    d = _fragile_ends_initial_matrix(seq_x, seq_y)
-    similarity = _wagner_fischer(seq_x, seq_y, _fragile_ends_costs, d)
+    # If the sequences are equal, no edit operation is needed
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    similarity = _fragile_ends_core(seq_x, seq_y)
 
     if normal:
         seq_x_list = [elem for elem in seq_x]
@@ -160,9 +186,11 @@ def stemmatological_simil(
     """
     Compute the "stemmatological" similarity between two sequences.
 
-    This function will use the standard Wagner-Fischer algorithm with the
-    default costs provided by the internal `_levdamerau_costs()`
-    function. This similarity measure is essentially a combination of the
+    This function will use the internal `_stemmatological_core()`
+    function, a rolling-window specialization of the standard
+    Wagner-Fischer algorithm for the "stemmatological" costs (as defined
+    by the internal `_stemmatological_costs_factory()` function). This
+    similarity measure is essentially a combination of the
     "fragile ends" and "bulk delete" methods, with the first one
     generalised a little to allow specifying the size of both fragile regions.
 
@@ -191,12 +219,11 @@ def stemmatological_simil(
     :return: The computed "stemmatological" similarity.
     """
 
-    d = _stemmatological_initial_matrix(seq_x, seq_y, max_del_len, frag_start, frag_end)
-    _stemmatology_costs = _stemmatological_costs_factory(
-        max_del_len, frag_start, frag_end
-    )
+    # If the sequences are equal, no edit operation is needed
+    if _is_identical(seq_x, seq_y):
+        return 0.0
 
-    dist = _wagner_fischer(seq_x, seq_y, _stemmatology_costs, d)
+    dist = _stemmatological_core(seq_x, seq_y, max_del_len, frag_start, frag_end)
 
     if normal:
         return dist / max([len(seq_x), len(seq_y)])
@@ -213,14 +240,22 @@ def stemmatological_simil(
 
 
 def levenshtein_dist(
-    seq_x: Sequence[Hashable], seq_y: Sequence[Hashable], normal: bool = False
+    seq_x: Sequence[Hashable],
+    seq_y: Sequence[Hashable],
+    normal: bool = False,
+    max_distance: Optional[int] = None,
 ) -> float:
     """
     Compute the Levenshtein distance between two sequences.
 
-    This function will use the standard Wagner-Fischer algorithm with the
-    default costs provided by the internal `_levenshtein_costs()`
-    function.
+    This function will use the internal `_levenshtein_core()` function,
+    a rolling-buffer specialization of the standard Wagner-Fischer
+    algorithm for the default costs (as provided by the internal
+    `_levenshtein_costs()` function). When `max_distance` is given, the
+    banded `_levenshtein_bounded()` kernel is used instead, which only
+    fills the cells around the main diagonal and saturates at
+    `max_distance` + 1; this is much faster when the caller only cares
+    whether two sequences are within a given distance of each other.
 
     .. code-block:: python
 
@@ -240,10 +275,20 @@ def levenshtein_dist(
     :param seq_y: The second sequence to be compared.
     :param normal: Whether to normalize the similarity score in range
         [0..1] using sequence lengths.
+    :param max_distance: An optional largest distance of interest; when
+        provided, the returned value is capped at `max_distance` + 1
+        (saturating the normalized score accordingly).
     :return: The computed Levenshtein distance.
     """
 
-    dist = _wagner_fischer(seq_x, seq_y, _levenshtein_costs)
+    # If the sequences are equal, no edit operation is needed
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    if max_distance is None:
+        dist = _levenshtein_core(seq_x, seq_y)
+    else:
+        dist = _levenshtein_bounded(seq_x, seq_y, max_distance)
 
     if normal:
         return dist / max([len(seq_x), len(seq_y)])
@@ -257,9 +302,10 @@ def levdamerau_dist(
     """
     Compute the Damerau-Levenshtein distance between two sequences.
 
-    This function will use the standard Wagner-Fischer algorithm with the
-    default costs provided by the internal `_levdamerau_costs()`
-    function.
+    This function will use the internal `_levdamerau_core()` function,
+    a rolling-buffer specialization of the standard Wagner-Fischer
+    algorithm for the default costs (as provided by the internal
+    `_levdamerau_costs()` function).
 
     .. code-block:: python
 
@@ -286,7 +332,11 @@ def levdamerau_dist(
     :return: The computed Levenshtein distance.
     """
 
-    dist = _wagner_fischer(seq_x, seq_y, _levdamerau_costs)
+    # If the sequences are equal, no edit operation is needed
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    dist = _levdamerau_core(seq_x, seq_y)
 
     if normal:
         return dist / max([len(seq_x), len(seq_y)])
@@ -304,9 +354,11 @@ def bulk_delete_dist(
     """
     Compute the "bulk delete" distance between two sequences.
 
-    This function will use the standard Wagner-Fischer algorithm with the
-    default costs provided by the internal `_levdamerau_costs()`
-    function. This distance measure is not used directly in the paper and was a
+    This function will use the internal `_bulk_delete_core()` function,
+    a rolling-window specialization of the standard Wagner-Fischer
+    algorithm for the "bulk delete" costs (as defined by the internal
+    `_bulk_delete_costs_factory()` function). This distance measure is not
+    used directly in the paper and was a
     proof-of-concept while working toward the "Stemmatological distance".
 
     Example
@@ -332,9 +384,11 @@ def bulk_delete_dist(
     :return: The computed "bulk delete" distance.
     """
 
-    d = _bulk_delete_initial_matrix(seq_x, seq_y, max_del_len)
-    _bulk_delete_costs = _bulk_delete_costs_factory(max_del_len)
-    dist = _wagner_fischer(seq_x, seq_y, _bulk_delete_costs, d)
+    # If the sequences are equal, no edit operation is needed
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    dist = _bulk_delete_core(seq_x, seq_y, max_del_len)
 
     if normal:
         return dist / max([len(seq_x), len(seq_y)])
@@ -384,7 +438,11 @@ def jaro_dist(
     :return: The Jaro distance between the two sequences.
     """
 
-    dist = textdistance.JaroWinkler(winklerize=False, external=False)(seq_x, seq_y)
+    # Identical sequences score a full match without computation
+    if _is_identical(seq_x, seq_y):
+        dist = 1.0
+    else:
+        dist = _JARO(seq_x, seq_y)
 
     if normal:
         logging.warning(
@@ -436,7 +494,11 @@ def jaro_winkler_dist(
     :return: The Jaro-Winkler distance between the two sequences.
     """
 
-    dist = textdistance.JaroWinkler(winklerize=True, external=False)(seq_x, seq_y)
+    # Identical sequences score a full match without computation
+    if _is_identical(seq_x, seq_y):
+        dist = 1.0
+    else:
+        dist = _JARO_WINKLER(seq_x, seq_y)
 
     if normal:
         logging.warning(
@@ -486,12 +548,33 @@ def mmcwpa_dist(
     # Cache original lengths, before any modifications
     len_a, len_b = len(seq_x), len(seq_y)
 
-    # Initialize the `f_x` and `f_y` vectors with a single element each,
-    # the corresponding sequence; we also initialize the `ssnc` to zero.
-    f_x, f_y = [seq_x], [seq_y]
-    ssnc: float = 0.0
-    while f_x and f_y:
-        f_x, f_y, ssnc = _mmcwpa(f_x, f_y, ssnc)
+    # Identical sequences fully match in a single window, so the SSNC
+    # can be written down directly
+    if _is_identical(seq_x, seq_y):
+        ssnc: int = (len_a + len_b) ** 2
+    else:
+        # Map the sequences to equivalent strings, so that the subfields
+        # handled by `_mmcwpa()` are plain strings: slicing is cheap and the
+        # first-occurrence lookup can rely on `str.find()` (which CPython
+        # implements with the Crochemore-Perrin "Two-Way" algorithm) instead
+        # of a brute-force scan. As with the previous integer coding, only
+        # element equality matters for the final score, so the mapping has no
+        # effect on the results.
+        seq_x, seq_y = equivalent_string(seq_x, seq_y)
+
+        # Initialize the `f_x` and `f_y` vectors with a single element each,
+        # the corresponding sequence; we also initialize the `ssnc` to zero.
+        # As `_mmcwpa()` updates the two vectors in place, the loop only needs
+        # to accumulate the SSNC increments, stopping when no match is found.
+        # The increments are squared integers, so the accumulator stays an
+        # integer until the final ratio is taken.
+        f_x, f_y = [seq_x], [seq_y]
+        ssnc = 0
+        while f_x and f_y:
+            gain = _mmcwpa(f_x, f_y)
+            if not gain:
+                break
+            ssnc += gain
 
     if normal:
         logging.warning(
@@ -541,7 +624,10 @@ def birnbaum_dist(
     if len(seq_y) > len(seq_x):
         seq_x, seq_y = seq_y, seq_x
 
-    distance = 1 - (birnbaum_simil(seq_x, seq_y) / birnbaum_simil(seq_y, seq_y))
+    # The self-similarity in the denominator is known analytically, as in
+    # `fast_birnbaum_dist()`
+    denom = (len(seq_y) * (len(seq_y) + 1)) // 2
+    distance = 1 - (birnbaum_simil(seq_x, seq_y) / denom)
 
     # Compute the distance and correct if necessary (as the distance returned
     # by the method can be less than zero when `seq_x` contains a perfect
@@ -629,29 +715,33 @@ def _levenshtein_costs(
     d: List[List[float]],
     i: int,
     j: int,
-) -> Tuple[float, float, float]:
+) -> float:
     """
-    Computes candidate costs for an entry of an edit distance matrix.
+    Computes the cost for an entry of an edit distance matrix.
 
-    This internal function will compute the candidate costs for an entry
-    (i, j) in terms of the Levenshtein distance matrix (seq_a, seq_b),
-    each cost corresponding to one of the available edit operations.
+    This internal function will compute the cost for an entry (i, j) in
+    terms of the Levenshtein distance matrix (seq_a, seq_b), taking the
+    cheapest of the available edit operations. The candidates are
+    compared with inline scalar tests instead of building a tuple and
+    calling `min()`, as this runs once per matrix cell.
 
     :param seq_x: The first sequence to be compared.
     :param seq_y: The second sequence to be compared.
     :param d: The "starting matrix" for the cost computation.
     :param i: The index of `seq_x` to be considered.
     :param j: The index of `seq_y` to be considered.
-    :return: A tuple with the costs for deletion, insertion, and substitution.
+    :return: The minimum cost among deletion, insertion, and substitution.
     """
-    substitution_cost = 0 if seq_x[i - 1] == seq_y[j - 1] else 1
-    costs = (
-        d[i - 1][j] + 1,  # del
-        d[i][j - 1] + 1,  # ins
-        d[i - 1][j - 1] + substitution_cost,
-    )
 
-    return costs
+    cost = d[i - 1][j - 1] + (seq_x[i - 1] != seq_y[j - 1])
+    deletion = d[i - 1][j] + 1
+    if deletion < cost:
+        cost = deletion
+    insertion = d[i][j - 1] + 1
+    if insertion < cost:
+        cost = insertion
+
+    return cost
 
 
 def _levdamerau_costs(
@@ -660,41 +750,45 @@ def _levdamerau_costs(
     d: List[List[float]],
     i: int,
     j: int,
-) -> Tuple[float, ...]:
+) -> float:
     """
-    Computes candidate costs for an entry of a Damerau-Levenshtein distance matrix.
+    Computes the cost for an entry of a Damerau-Levenshtein distance matrix.
 
-    This internal function will compute the candidate costs for an entry
-    (i, j) in terms of the Damerau-Levenshtein distance matrix (seq_a, seq_b),
-    each cost corresponding to one of the available edit operations.
+    This internal function will compute the cost for an entry (i, j) in
+    terms of the Damerau-Levenshtein distance matrix (seq_a, seq_b),
+    taking the cheapest of the available edit operations.
 
     :param seq_x: The first sequence to be compared.
     :param seq_y: The second sequence to be compared.
     :param d: The "starting matrix" for the cost computation.
     :param i: The index of `seq_x` to be considered.
     :param j: The index of `seq_y` to be considered.
-    :return: A tuple with the costs for deletion, insertion, and substitution,
-        and the transposition cost if necessary.
+    :return: The minimum cost among deletion, insertion, substitution,
+        and transposition (when applicable).
     """
 
-    # Start out as per Levenshtein
-    substitution_cost = 0 if seq_x[i - 1] == seq_y[j - 1] else 1
-    costs = [
-        d[i - 1][j] + 1,
-        d[i][j - 1] + 1,
-        d[i - 1][j - 1] + substitution_cost,
-    ]
-
-    # Add the transposition cost
+    # Start out as per Levenshtein, with the substitution cost expressed
+    # branchlessly as the truth value of the mismatch itself
+    cost = d[i - 1][j - 1] + (seq_x[i - 1] != seq_y[j - 1])
+    deletion = d[i - 1][j] + 1
+    if deletion < cost:
+        cost = deletion
+    insertion = d[i][j - 1] + 1
+    if insertion < cost:
+        cost = insertion
+
+    # Consider the transposition cost
     if (
         i > 1
         and j > 1
         and seq_x[i - 1] == seq_y[j - 2]
         and seq_x[i - 2] == seq_y[j - 1]
     ):
-        costs.append(d[i - 2][j - 2] + 1)
+        transposition = d[i - 2][j - 2] + 1
+        if transposition < cost:
+            cost = transposition
 
-    return tuple(costs)
+    return cost
 
 
 # TODO: return type and description
@@ -739,36 +833,87 @@ def _fragile_ends_costs(
     d: List[List[float]],
     i: int,
     j: int,
-) -> Tuple[float, ...]:
+) -> float:
     """
-    Computes candidate costs for an entry of a "fragile ends" distance matrix.
+    Computes the cost for an entry of a "fragile ends" distance matrix.
 
-    This internal function will compute the candidate costs for an entry
-    (i, j) in terms of the Levenshtein distance matrix (seq_a, seq_b),
-    each cost corresponding to one of the available edit operations.
+    This internal function will compute the cost for an entry (i, j) in
+    terms of the Levenshtein distance matrix (seq_a, seq_b), taking the
+    cheapest of the available edit operations.
 
     :param seq_x: The first sequence to be compared.
     :param seq_y: The second sequence to be compared.
     :param d: The "starting matrix" for the cost computation.
     :param i: The index of `seq_x` to be considered.
     :param j: The index of `seq_y` to be considered.
-    :return: A tuple with the costs for deletion, insertion, and substitution.
+    :return: The minimum cost among deletion, insertion, and substitution.
     """
 
-    substitution_cost = 0 if seq_x[i - 1] == seq_y[j - 1] else 1
-    costs = [
-        d[i][j - 1] + 1,
-        d[i - 1][j - 1] + substitution_cost,
-    ]
+    # Bind the previous row once instead of re-subscripting `d` for
+    # every candidate
+    row_prev = d[i - 1]
+    cost = row_prev[j - 1] + (seq_x[i - 1] != seq_y[j - 1])
+    insertion = d[i][j - 1] + 1
+    if insertion < cost:
+        cost = insertion
 
     # Discount deletion near ends
     m = len(seq_x)
     if i <= round(0.1 * m) or i >= round(0.9 * m):
-        costs.append(d[i - 1][j] + 0.5)
+        deletion = row_prev[j] + 0.5
     else:
-        costs.append(d[i - 1][j] + 1)
+        deletion = row_prev[j] + 1
+    if deletion < cost:
+        cost = deletion
+
+    return cost
+
+
+def _fragile_ends_core(seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]) -> float:
+    """
+    Computes the "fragile ends" similarity with a two-row rolling buffer.
+
+    This is a specialization of `_wagner_fischer()` with
+    `_fragile_ends_costs()`: the recurrence only consults the previous
+    row, so only two rows are kept instead of the full matrix, with the
+    first-column discounts of `_fragile_ends_initial_matrix()` computed
+    on the fly. Note that the buffers cannot be rolled in the generic
+    engine itself, as other cost functions (such as the "bulk delete"
+    ones) reach further back into the matrix.
 
-    return tuple(costs)
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The computed "fragile ends" similarity.
+    """
+
+    # The measure is not symmetric (the fragile regions are relative to
+    # `seq_x` only), so unlike the Levenshtein kernels the sequences
+    # must not be swapped
+    m = len(seq_x)
+    n = len(seq_y)
+    frag_start = round(0.1 * m)
+    frag_end = round(0.9 * m)
+
+    prev: List[float] = list(range(n + 1))
+    first_col = 0.0
+    for i, elem_x in enumerate(seq_x, 1):
+        # Deletions in the fragile regions are discounted, both in the
+        # first column and in the candidate costs below
+        del_cost = 0.5 if i <= frag_start or i >= frag_end else 1.0
+        first_col += del_cost
+        curr: List[float] = [first_col] + [0.0] * n
+        for j, elem_y in enumerate(seq_y, 1):
+            cost = prev[j - 1] + (elem_x != elem_y)  # substitution
+            deletion = prev[j] + del_cost
+            if deletion < cost:
+                cost = deletion
+            insertion = curr[j - 1] + 1
+            if insertion < cost:
+                cost = insertion
+            curr[j] = cost
+        prev = curr
+
+    return prev[n]
 
 
 # TODO: return type and description
@@ -798,12 +943,9 @@ def _bulk_delete_initial_matrix(
     d = [[0 for i in range(0, n + 1)] for j in range(0, m + 1)]
 
     # Bulk deletions
+    first_column = _bulk_delete_first_column(m, max_del_len)
     for i in range(1, m + 1):
-        bulk_deletions = int(i / max_del_len)
-        d[i][0] = bulk_deletions
-        remainder = i - bulk_deletions * max_del_len
-        if remainder:
-            d[i][0] += 1
+        d[i][0] = first_column[i]
 
     # Insertions
     for j in range(1, n + 1):
@@ -812,47 +954,124 @@ def _bulk_delete_initial_matrix(
     return d
 
 
+def _bulk_delete_first_column(length: int, max_del_len: int) -> List[float]:
+    """
+    Compute the first matrix column for the "bulk delete" costs.
+
+    The column holds the cost of deleting the first `i` elements of the
+    first sequence in blocks of up to `max_del_len`; it is all the
+    starting information needed by the windowed Wagner-Fischer engine.
+
+    :param length: The length of the first sequence.
+    :param max_del_len: The maximum length of deletion block.
+    :return: The first column of the starting matrix.
+    """
+
+    column: List[float] = [0]
+    for i in range(1, length + 1):
+        bulk_deletions = int(i / max_del_len)
+        cost = bulk_deletions
+        if i - bulk_deletions * max_del_len:
+            cost += 1
+        column.append(cost)
+
+    return column
+
+
+def _bulk_delete_core(
+    seq_x: Sequence[Hashable], seq_y: Sequence[Hashable], max_del_len: int
+) -> float:
+    """
+    Computes the "bulk delete" distance with a rolling window of rows.
+
+    This inlines the costs of `_bulk_delete_costs_factory()` directly
+    into the fill loop, so no per-cell Python call is made; only the
+    last `max_del_len` rows are kept, as in the windowed Wagner-Fischer
+    engine, since the deletion candidates reach at most that far up.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :param max_del_len: The maximum length of deletion block.
+    :return: The computed "bulk delete" distance.
+    """
+
+    n = len(seq_y)
+    first_column = _bulk_delete_first_column(len(seq_x), max_del_len)
+    window: deque = deque(maxlen=max_del_len)
+    row: List[float] = list(range(n + 1))
+    window.append(row)
+    for i, elem_x in enumerate(seq_x, 1):
+        prev = window[-1]
+        curr: List[float] = [first_column[i]] + [0.0] * n
+        depth = min(max_del_len + 1, i)
+        for j, elem_y in enumerate(seq_y, 1):
+            cost = prev[j - 1] + (elem_x != elem_y)  # substitution
+            insertion = curr[j - 1] + 1
+            if insertion < cost:
+                cost = insertion
+            for back in range(1, depth):
+                # Delete consecutive block of `back`
+                deletion = window[-back][j] + 1
+                if deletion < cost:
+                    cost = deletion
+            curr[j] = cost
+        window.append(curr)
+        row = curr
+
+    return row[n]
+
+
 # TODO: return description
+@functools.lru_cache(maxsize=32)
 def _bulk_delete_costs_factory(max_del_len: int = 5) -> Callable:
     """
     Define and return a function for computing candidate costs for a "bulk delete" distance matrix.
 
+    The factory is memoized, so pairwise comparisons over a corpus with
+    the same parameters share a single closure instead of rebuilding it
+    on every call.
+
     :param max_del_len: The maximum length of deletion block.
     :return:
     """
 
+    # Hoisted out of the per-cell closure
+    cap = max_del_len + 1
+
     def _bulk_delete_costs(
         seq_x: Sequence[Hashable],
         seq_y: Sequence[Hashable],
         d: List[List[float]],
         i: int,
         j: int,
-    ) -> Tuple[float, ...]:
+    ) -> float:
         """
-        Computes candidate costs for an entry of a "bulk delete" distance matrix.
+        Computes the cost for an entry of a "bulk delete" distance matrix.
 
-        This internal function will compute the candidate costs for an entry
-        (i, j) in terms of the Levenshtein distance matrix (seq_a, seq_b),
-        each cost corresponding to one of the available edit operations.
+        This internal function will compute the cost for an entry (i, j)
+        in terms of the Levenshtein distance matrix (seq_a, seq_b),
+        taking the cheapest of the available edit operations.
 
         :param seq_x: The first sequence to be compared.
         :param seq_y: The second sequence to be compared.
         :param d: The "starting matrix" for the cost computation.
         :param i: The index of `seq_x` to be considered.
         :param j: The index of `seq_y` to be considered.
-        :return: A tuple with the costs for deletion, insertion, and substitution.
+        :return: The minimum cost among bulk deletion, insertion, and
+            substitution.
         """
 
-        substitution_cost = 0 if seq_x[i - 1] == seq_y[j - 1] else 1
-        costs = [
-            d[i][j - 1] + 1,  # ins
-            d[i - 1][j - 1] + substitution_cost,
-        ]
-        for n in range(1, min(max_del_len + 1, i)):
+        cost = d[i - 1][j - 1] + (seq_x[i - 1] != seq_y[j - 1])
+        insertion = d[i][j - 1] + 1
+        if insertion < cost:
+            cost = insertion
+        for n in range(1, min(cap, i)):
             # Delete consecutive block of n
-            costs.append(d[i - n][j] + 1)
+            deletion = d[i - n][j] + 1
+            if deletion < cost:
+                cost = deletion
 
-        return tuple(costs)
+        return cost
 
     return _bulk_delete_costs
 
@@ -887,13 +1106,9 @@ def _stemmatological_initial_matrix(
     m = len(seq_x)
     n = len(seq_y)
     d = [[0 for i in range(0, n + 1)] for j in range(0, m + 1)]
-    lower = round(m * frag_start / 100.0)
-    upper = round(m * (100 - frag_end) / 100.0)
+    first_column = _stemmatological_first_column(m, max_del_len, frag_start, frag_end)
     for i in range(1, m + 1):
-        if i <= lower or i >= upper:
-            d[i][0]: float = d[i - min(i, max_del_len)][0] + 0.5
-        else:
-            d[i][0]: float = d[i - min(i, max_del_len)][0] + 1.0
+        d[i][0] = first_column[i]
 
     # Insertions
     for j in range(1, n + 1):
@@ -902,143 +1117,452 @@ def _stemmatological_initial_matrix(
     return d
 
 
+# TODO: frag type and description
+def _stemmatological_first_column(
+    length: int,
+    max_del_len: int = 5,
+    frag_start: float = 10.0,
+    frag_end: float = 10.0,
+) -> List[float]:
+    """
+    Compute the first matrix column for the "stemmatological" costs.
+
+    As with `_bulk_delete_first_column()`, the column holds the cost of
+    deleting the first `i` elements of the first sequence, here with the
+    deletions in the fragile regions discounted; it is all the starting
+    information needed by the windowed Wagner-Fischer engine.
+
+    :param length: The length of the first sequence.
+    :param max_del_len: The maximum length of deletion block.
+    :param frag_start:
+    :param frag_end:
+    :return: The first column of the starting matrix.
+    """
+
+    lower = round(length * frag_start / 100.0)
+    upper = round(length * (100 - frag_end) / 100.0)
+    column: List[float] = [0]
+    for i in range(1, length + 1):
+        if i <= lower or i >= upper:
+            column.append(column[i - min(i, max_del_len)] + 0.5)
+        else:
+            column.append(column[i - min(i, max_del_len)] + 1.0)
+
+    return column
+
+
+def _stemmatological_core(
+    seq_x: Sequence[Hashable],
+    seq_y: Sequence[Hashable],
+    max_del_len: int = 5,
+    frag_start: float = 10.0,
+    frag_end: float = 10.0,
+) -> float:
+    """
+    Computes the "stemmatological" similarity with a rolling window of rows.
+
+    As with `_bulk_delete_core()`, the costs of
+    `_stemmatological_costs_factory()` are inlined into the fill loop,
+    avoiding the per-cell Python call; the fragile-region bounds and the
+    per-row deletion discount are computed outside the inner loop.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :param max_del_len: The maximum length of deletion block.
+    :param frag_start:
+    :param frag_end:
+    :return: The computed "stemmatological" similarity.
+    """
+
+    m = len(seq_x)
+    n = len(seq_y)
+    lower = round(m * frag_start / 100.0)
+    upper = round(m * (100 - frag_end) / 100.0)
+    first_column = _stemmatological_first_column(m, max_del_len, frag_start, frag_end)
+    window: deque = deque(maxlen=max_del_len)
+    row: List[float] = list(range(n + 1))
+    window.append(row)
+    for i, elem_x in enumerate(seq_x, 1):
+        prev = window[-1]
+        # Discount bulk deletion near ends
+        del_increment = 0.5 if i <= lower or i >= upper else 1
+        depth = min(max_del_len, i)
+        curr: List[float] = [first_column[i]] + [0.0] * n
+        for j, elem_y in enumerate(seq_y, 1):
+            cost = prev[j - 1] + (elem_x != elem_y)  # substitution
+            insertion = curr[j - 1] + 1
+            if insertion < cost:
+                cost = insertion
+            for back in range(1, depth):
+                # Delete consecutive block of `back`
+                deletion = window[-back][j] + del_increment
+                if deletion < cost:
+                    cost = deletion
+            curr[j] = cost
+        window.append(curr)
+        row = curr
+
+    return row[n]
+
+
 # TODO: frag type and description
 # TODO: return description
+@functools.lru_cache(maxsize=32)
 def _stemmatological_costs_factory(
-    max_del_len: int = 5, frag_start: float = 10.0, frag_end: float = 10.0
+    max_del_len: int = 5,
+    frag_start: float = 10.0,
+    frag_end: float = 10.0,
+    length: Optional[int] = None,
 ) -> Callable:
     """
     Define and return a function for computing candidate costs for a "stemmatological" distance matrix.
 
+    The factory is memoized, so pairwise comparisons over a corpus with
+    the same parameters (including the sequence length) share a single
+    closure instead of rebuilding it on every call.
+
     :param max_del_len: The maximum length of deletion block.
     :param frag_start:
     :param frag_end:
+    :param length: The length of the first sequence, when known in
+        advance; passing it allows the fragile-region boundaries to be
+        computed once here instead of once per cell.
     :return:
     """
 
+    # Hoist the fragile-region boundaries out of the per-cell closure
+    # whenever the sequence length is known up front
+    if length is not None:
+        fixed_bounds = (
+            round(length * frag_start / 100.0),
+            round(length * (100 - frag_end) / 100.0),
+        )
+    else:
+        fixed_bounds = None
+
     def _stemmatological_costs(
         seq_x: Sequence[Hashable],
         seq_y: Sequence[Hashable],
         d: List[List[float]],
         i: int,
         j: int,
-    ):
+    ) -> float:
         """
-        Computes candidate costs for an entry of a "stemmatological" distance matrix.
+        Computes the cost for an entry of a "stemmatological" distance matrix.
 
-        This internal function will compute the candidate costs for an entry
-        (i, j) in terms of the Levenshtein distance matrix (seq_a, seq_b),
-        each cost corresponding to one of the available edit operations.
+        This internal function will compute the cost for an entry (i, j)
+        in terms of the Levenshtein distance matrix (seq_a, seq_b),
+        taking the cheapest of the available edit operations.
 
         :param seq_x: The first sequence to be compared.
         :param seq_y: The second sequence to be compared.
         :param d: The "starting matrix" for the cost computation.
         :param i: The index of `seq_x` to be considered.
         :param j: The index of `seq_y` to be considered.
-        :return: A tuple with the costs for deletion, insertion, and substitution.
+        :return: The minimum cost among bulk deletion, insertion, and
+            substitution.
         """
-        substitution_cost = 0 if seq_x[i - 1] == seq_y[j - 1] else 1
-        costs = [
-            d[i][j - 1] + 1,
-            d[i - 1][j - 1] + substitution_cost,
-        ]
-        m = len(seq_x)
-        lower = round(m * frag_start / 100.0)
-        upper = round(m * (100 - frag_end) / 100.0)
+
+        cost = d[i - 1][j - 1] + (seq_x[i - 1] != seq_y[j - 1])
+        insertion = d[i][j - 1] + 1
+        if insertion < cost:
+            cost = insertion
+        if fixed_bounds is not None:
+            lower, upper = fixed_bounds
+        else:
+            m = len(seq_x)
+            lower = round(m * frag_start / 100.0)
+            upper = round(m * (100 - frag_end) / 100.0)
+
+        # Discount bulk deletion near ends
+        del_increment = 0.5 if i <= lower or i >= upper else 1
 
         # Delete consecutive block of n
         for n in range(1, min(max_del_len, i)):
-            # Discount bulk deletion near ends
-            if i <= lower or i >= upper:
-                costs.append(d[i - n][j] + 0.5)
-            else:
-                costs.append(d[i - n][j] + 1)
+            deletion = d[i - n][j] + del_increment
+            if deletion < cost:
+                cost = deletion
 
-        return costs
+        return cost
 
     return _stemmatological_costs
 
 
-def _mmcwpa(
-    seq_x: List[Sequence[Hashable]], seq_y: List[Sequence[Hashable]], ssnc: float
-) -> Tuple[List[Sequence[Hashable]], List[Sequence[Hashable]], float]:
+def _suffix_automaton(sequence: Sequence[Hashable]):
+    """
+    Builds a suffix automaton for a sequence of hashable elements.
+
+    The automaton recognizes exactly the sub-sequences (factors) of the
+    input and is built online in linear time with Blumer/Crochemore's
+    construction; it is used by `_mmcwpa()` to locate longest common
+    sub-sequences with a single pass per pattern.
+
+    See: Crochemore, Maxime; Hancart, Christophe (1997). "Automata for
+    matching patterns". Handbook of Formal Languages 2: 399-462.
+
+    :param sequence: The sequence to be indexed.
+    :return: A tuple of three parallel lists (state lengths, suffix
+        links, and transition dictionaries), with state 0 as the root.
+    """
+
+    sa_len = [0]
+    sa_link = [-1]
+    sa_next: List[Dict[Hashable, int]] = [{}]
+    last = 0
+    for element in sequence:
+        curr = len(sa_len)
+        sa_len.append(sa_len[last] + 1)
+        sa_link.append(-1)
+        sa_next.append({})
+        p = last
+        while p != -1 and element not in sa_next[p]:
+            sa_next[p][element] = curr
+            p = sa_link[p]
+        if p == -1:
+            sa_link[curr] = 0
+        else:
+            q = sa_next[p][element]
+            if sa_len[p] + 1 == sa_len[q]:
+                sa_link[curr] = q
+            else:
+                clone = len(sa_len)
+                sa_len.append(sa_len[p] + 1)
+                sa_link.append(sa_link[q])
+                sa_next.append(dict(sa_next[q]))
+                while p != -1 and sa_next[p].get(element) == q:
+                    sa_next[p][element] = clone
+                    p = sa_link[p]
+                sa_link[q] = clone
+                sa_link[curr] = clone
+        last = curr
+
+    return sa_len, sa_link, sa_next
+
+
+def _longest_match(
+    seq_x: Sequence[Hashable],
+    x_lo: int,
+    x_hi: int,
+    seq_y: Sequence[Hashable],
+    y_lo: int,
+    y_hi: int,
+) -> Tuple[int, int, int]:
+    """
+    Finds the longest matching block between two sequence slices.
+
+    The result follows the tie-breaking of
+    `difflib.SequenceMatcher.find_longest_match()`: of all maximal
+    matching blocks, the one starting earliest in `seq_x` and, among
+    those, earliest in `seq_y`. The search walks the `seq_x` slice
+    through a suffix automaton of the `seq_y` slice, so it is linear in
+    the slice lengths instead of the product-of-occurrences walk that
+    `difflib` performs.
+
+    :param seq_x: The first sequence to be compared.
+    :param x_lo: The start of the slice of `seq_x` to be considered.
+    :param x_hi: The end of the slice of `seq_x` to be considered.
+    :param seq_y: The second sequence to be compared.
+    :param y_lo: The start of the slice of `seq_y` to be considered.
+    :param y_hi: The end of the slice of `seq_y` to be considered.
+    :return: A tuple (i, j, k) such that seq_x[i:i+k] == seq_y[j:j+k].
+    """
+
+    region = seq_y[y_lo:y_hi]
+    sa_len, sa_link, sa_next = _suffix_automaton(region)
+
+    # Earliest end position, within the region, of any occurrence of the
+    # strings of each state: the states on the path spelled by the region
+    # itself get their creation position, which then propagates along the
+    # suffix links (whose end position sets are supersets)
+    min_end = [len(region) + 1] * len(sa_len)
+    state = 0
+    for pos, element in enumerate(region, 1):
+        state = sa_next[state][element]
+        min_end[state] = pos
+    for state in sorted(range(len(sa_len)), key=sa_len.__getitem__, reverse=True):
+        parent = sa_link[state]
+        if parent >= 0 and min_end[state] < min_end[parent]:
+            min_end[parent] = min_end[state]
+
+    # Walk the `seq_x` slice through the automaton; the first position
+    # reaching the maximum match length also starts earliest
+    best_length = 0
+    best_end_x = x_lo
+    best_state = 0
+    state = 0
+    length = 0
+    for pos in range(x_lo, x_hi):
+        element = seq_x[pos]
+        while state and element not in sa_next[state]:
+            state = sa_link[state]
+            length = sa_len[state]
+        if element in sa_next[state]:
+            state = sa_next[state][element]
+            length += 1
+        else:
+            length = 0
+        if length > best_length:
+            best_length = length
+            best_end_x = pos + 1
+            best_state = state
+
+    if not best_length:
+        return x_lo, y_lo, 0
+
+    # The matched block may be a proper suffix of the strings of the
+    # final state; climb to the state that actually represents it before
+    # reading the earliest end position in `seq_y`
+    state = best_state
+    while sa_link[state] >= 0 and sa_len[sa_link[state]] >= best_length:
+        state = sa_link[state]
+
+    return (
+        best_end_x - best_length,
+        y_lo + min_end[state] - best_length,
+        best_length,
+    )
+
+
+def _matching_block_sizes(
+    seq_x: Sequence[Hashable], seq_y: Sequence[Hashable]
+) -> List[int]:
+    """
+    Computes the sizes of the matching blocks between two sequences.
+
+    This reproduces the greedy decomposition of
+    `difflib.SequenceMatcher.get_matching_blocks()` (including the
+    merging of adjacent blocks), with each region pair resolved by
+    `_longest_match()` instead of `difflib`'s quadratic walk. It must
+    only be used where `difflib`'s "autojunk" heuristic would not
+    trigger, i.e. when `seq_y` is shorter than 200 elements, so that
+    the results stay identical.
+
+    :param seq_x: The first sequence to be compared.
+    :param seq_y: The second sequence to be compared.
+    :return: The sizes of the matching blocks.
+    """
+
+    blocks = []
+    regions = [(0, len(seq_x), 0, len(seq_y))]
+    while regions:
+        x_lo, x_hi, y_lo, y_hi = regions.pop()
+        i, j, k = _longest_match(seq_x, x_lo, x_hi, seq_y, y_lo, y_hi)
+        if k:
+            blocks.append((i, j, k))
+            regions.append((x_lo, i, y_lo, j))
+            regions.append((i + k, x_hi, j + k, y_hi))
+
+    # Merge adjacent blocks, as `difflib` does
+    blocks.sort()
+    sizes = []
+    i1 = j1 = k1 = 0
+    for i2, j2, k2 in blocks:
+        if i1 + k1 == i2 and j1 + k1 == j2:
+            k1 += k2
+        else:
+            if k1:
+                sizes.append(k1)
+            i1, j1, k1 = i2, j2, k2
+    if k1:
+        sizes.append(k1)
+
+    return sizes
+
+
+def _mmcwpa(seq_x: List[Sequence[Hashable]], seq_y: List[Sequence[Hashable]]) -> int:
     """
     Internal function for MMCWPA implementation.
 
     In this implementation of the Modified Moving Contracting Window Pattern Algorithm
-    (MMCWPA) to calculate sequence similarity, we return a list of non-overlapping,
-    non-contiguous fields Fx, a list of non-overlapping, non-contiguous fields Fy, and
-    the SSNC value (the Sum of the Square of the Number of the same characters). This
-    function separates the core method of the implementation and makes recursive calls
-    easier.
+    (MMCWPA) to calculate sequence similarity, the list of non-overlapping,
+    non-contiguous fields Fx and the list of non-overlapping, non-contiguous fields Fy
+    are updated in place, and the increment to the SSNC value (the Sum of the Square
+    of the Number of the same characters) is returned. This function separates the
+    core method of the implementation and makes the driving loop easier.
+
+    The longest sub-sequence shared by any subfield of Fx and any
+    subfield of Fy is found by walking each subfield of Fx through a
+    generalized suffix automaton built once over all subfields of Fy, so
+    each call is linear in the total lengths instead of the quadratic
+    common-substring table per subfield pair. Ties on the length are
+    broken in favor of the earliest subfield of Fx, then the leftmost
+    starting index within it, then the first subfield of Fy where the
+    pattern occurs. Note that all subfields of Fx now take part in the
+    search: earlier revisions stopped at the first subfield, missing
+    longer matches further down the list.
 
     :param seq_x: A list of sub-sequences, related to the first sequence.
     :param seq_y: A list of sub-sequences, related to the second sequence.
-    :param ssnc: The previous SSNC value.
-    :return: A tuple whose first element is a list of remaining sub-sequences from the
-             first sequence, the second element is a list of remaining sub-sequences
-             from the second sequence, and the third element is the updated SSNC.
+    :return: The increment to the SSNC value; an increment of zero signals that no
+             match was found and that the comparison is over.
     """
 
-    # the boolean value indicating if a total or partial
-    # match was found between subfields Fx and Fy; when
-    # a match is found, the variable is used to cascade
-    # out of the loops of the function
-    match = False
-
-    # the variables where to store the new collections of
-    # subfields, if any match is found; if these values
-    # are not changed and the empty lists are returned,
-    # stringcomp() will break the loop of comparison,
-    # calculate the similarity ratio and return its value
-    new_f_x, new_f_y = [], []
-
-    # search patterns in all subfields of Fx; the index of
-    # the subfield in the list is used for upgrading the
-    # list, if a pattern is a found
+    # Index all subfields of Fy in one automaton, separated by unique
+    # sentinels so that no match can span a subfield boundary
+    concat: List[Hashable] = []
+    for idx_y, sf_y in enumerate(seq_y):
+        if idx_y:
+            concat.append(object())
+        concat.extend(sf_y)
+    sa_len, sa_link, sa_next = _suffix_automaton(concat)
+
+    # Walk every subfield of Fx through the automaton, keeping the
+    # longest (then earliest, then leftmost) match found
+    best_length = 0
+    best_idx_x = 0
+    best_start = 0
     for idx_x, sf_x in enumerate(seq_x):
-        # 'length' stores the length of the sliding window,
-        # from full length to a single character
-        for length in range(len(sf_x), 0, -1):
-            # 'i' stores the starting index of the sliding
-            # window in Fx
-            for i in range(len(sf_x) - length + 1):
-                # extract the pattern for matching
-                pattern = sf_x[i : i + length]
-
-                # look for the pattern in Fy
-                for idx_y, sf_y in enumerate(seq_y):
-                    # 'j' stores the starting index in Fy; the
-                    # Python find() function returns -1 if there
-                    # is no match
-                    j = sequence_find(sf_y, pattern)
-                    if j is not None and not match:
-                        # the pattern was found; set 'new_fx' and
-                        # 'new_fy' to version of 'fx' and 'fy' with
-                        # the patterns removed, update the SSNC and
-                        # set 'match' as True, in order to cascade
-                        # out of the loops
-                        tmp_x = [sf_x[:i], sf_x[i + length :]]
-                        tmp_y = [sf_y[:j], sf_y[j + length :]]
-                        new_f_x = seq_x[:idx_x] + tmp_x + seq_x[idx_x + 1 :]
-                        new_f_y = seq_y[:idx_y] + tmp_y + seq_y[idx_y + 1 :]
-
-                        ssnc += (2 * length) ** 2
-
-                        match = True
-
-                        break
-
-                # if a match was found, end the sliding window
-                if match:
-                    break
-
-            # if a match was found, end Fx subfield enumeration
-            if match:
-                break
-
-        # remove any empty subfields due to pattern removal
-        new_f_x = [sf for sf in new_f_x if sf]
-        new_f_y = [sf for sf in new_f_y if sf]
-
-        return new_f_x, new_f_y, ssnc
+        # A subfield no longer than the best match cannot strictly
+        # improve on it, and ties go to earlier subfields
+        if len(sf_x) <= best_length:
+            continue
+        state = 0
+        length = 0
+        for pos, element in enumerate(sf_x):
+            while state and element not in sa_next[state]:
+                state = sa_link[state]
+                length = sa_len[state]
+            if element in sa_next[state]:
+                state = sa_next[state][element]
+                length += 1
+            else:
+                length = 0
+            if length > best_length:
+                best_length = length
+                best_idx_x = idx_x
+                best_start = pos - length + 1
+
+    if not best_length:
+        # no pattern was found; report a zero increment so the caller
+        # breaks the loop of comparison, calculates the similarity
+        # ratio and returns its value
+        return 0
+
+    # the pattern was found; splice the leftovers of the matched
+    # subfields into the lists in place, skipping any empty leftover,
+    # instead of rebuilding both lists by concatenation
+    i = best_start
+    length = best_length
+    sf_x = seq_x[best_idx_x]
+    pattern = sf_x[i : i + length]
+
+    # 'j' stores the starting index of the first occurrence in Fy;
+    # `sequence_find()` defers to `str.find()` for string subfields
+    for best_idx_y, sf_y in enumerate(seq_y):
+        j = sequence_find(sf_y, pattern)
+        if j is not None:
+            break
+
+    del seq_x[best_idx_x]
+    if sf_x[i + length :]:
+        seq_x.insert(best_idx_x, sf_x[i + length :])
+    if sf_x[:i]:
+        seq_x.insert(best_idx_x, sf_x[:i])
+
+    del seq_y[best_idx_y]
+    if sf_y[j + length :]:
+        seq_y.insert(best_idx_y, sf_y[j + length :])
+    if sf_y[:j]:
+        seq_y.insert(best_idx_y, sf_y[:j])
+
+    return 4 * length * length
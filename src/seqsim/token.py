@@ -7,14 +7,34 @@ iterable data structures.
 """
 
 # Import Python standard libraries
-from typing import Hashable, Sequence
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, Sequence, Tuple
+import functools
 import logging
 
 # Import 3rd-party libraries
+import numpy as np
 import textdistance
 
 # Import local modules
-from .common import collect_subseqs
+from .common import collect_subseqs_iter, _is_identical
+
+
+@functools.lru_cache(maxsize=1024)
+def _element_set(seq: Tuple[Hashable, ...]) -> FrozenSet:
+    """
+    Returns the set of distinct elements of a sequence, memoized.
+
+    As with `_subseq_buckets()`, in pairwise workloads the same sequence
+    is compared against many partners; caching on the tuple form means
+    each sequence is hashed into a set only once per process.
+
+    :param seq: The sequence, as a tuple.
+    :return: The distinct elements of the sequence.
+    """
+
+    return frozenset(seq)
+
 
 # TODO: have a jaccard similarity?
 def jaccard_dist(
@@ -46,17 +66,90 @@ def jaccard_dist(
     :return: The Jaccard distance between the two sequences.
     """
 
-    intersection_card = len(set(seq_x).intersection(set(seq_y)))
-    union_card = float(len(set(seq_x).union(set(seq_y))))
-
     if normal:
         logging.warning(
             "Jaccard distance is always in [0..1] range, no need for `normal` parameter."
         )
 
+    # Identical sequences need no computation
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    # Fetch each element set once (memoized across calls) and derive the
+    # union cardinality by inclusion-exclusion, instead of hashing every
+    # element twice and allocating a third, union set
+    set_x = _element_set(tuple(seq_x))
+    set_y = _element_set(tuple(seq_y))
+    intersection_card = len(set_x.intersection(set_y))
+    union_card = float(len(set_x) + len(set_y) - intersection_card)
+
     return 1.0 - (intersection_card / union_card)
 
 
+def jaccard_matrix(seqs: Sequence[Sequence[Hashable]]) -> np.ndarray:
+    """
+    Computes the matrix of pairwise Jaccard distances over a corpus.
+
+    Calling `jaccard_dist()` for every pair of a corpus hashes each
+    sequence once per pair. This function instead encodes every sequence
+    a single time into a presence row over the union alphabet; the
+    pairwise intersection cardinalities then come out of one matrix
+    product over the contiguous presence matrix, and the unions follow
+    by inclusion-exclusion.
+
+    Example
+    ********
+
+    .. code-block:: python
+
+        >>> seqsim.token.jaccard_matrix(["abc", "bcde"])
+        array([[0. , 0.6],
+               [0.6, 0. ]])
+
+    :param seqs: The sequences to be compared.
+    :return: A square matrix with the Jaccard distance between each
+        pair of sequences; pairs of empty sequences score 0.0.
+    """
+
+    # Intern the union alphabet and mark element presence per sequence
+    coder: Dict[Hashable, int] = {}
+    ids_per_seq = [
+        {coder.setdefault(element, len(coder)) for element in seq} for seq in seqs
+    ]
+    presence = np.zeros((len(seqs), len(coder)), dtype=np.int64)
+    for idx, ids in enumerate(ids_per_seq):
+        presence[idx, sorted(ids)] = 1
+
+    # Intersection cardinalities in a single product; unions by
+    # inclusion-exclusion over the row sums
+    intersection = presence @ presence.T
+    sizes = presence.sum(axis=1)
+    union = sizes[:, np.newaxis] + sizes[np.newaxis, :] - intersection
+
+    return np.where(union > 0, 1.0 - intersection / np.maximum(union, 1), 0.0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _subseq_buckets(seq: Tuple[Hashable, ...]) -> Dict[int, FrozenSet]:
+    """
+    Collects the sub-sequences of a sequence, bucketed by length.
+
+    The buckets are all that `subseq_jaccard_dist()` needs from a
+    sequence, and in pairwise workloads over a corpus the same sequence
+    is compared against many others; memoizing on the (hashable) tuple
+    form means each sequence is decomposed only once per process.
+
+    :param seq: The sequence to be decomposed, as a tuple.
+    :return: A dictionary of sub-sequence sets, keyed by length.
+    """
+
+    buckets = defaultdict(set)
+    for subseq in collect_subseqs_iter(seq):
+        buckets[len(subseq)].add(tuple(subseq))
+
+    return {length: frozenset(subseqs) for length, subseqs in buckets.items()}
+
+
 # TODO: rename appropriately with other methods, consider ngram usage
 # TODO: have a subseq_jaccard similarity?
 def subseq_jaccard_dist(
@@ -88,33 +181,46 @@ def subseq_jaccard_dist(
     :return: The Subseq-Jaccard distance between the two sequences.
     """
 
-    subseqs1 = collect_subseqs(seq_x)
-    subseqs2 = collect_subseqs(seq_y)
+    if normal:
+        logging.warning(
+            "Subseq-Jaccard distance is always in [0..1] range, no need for `normal` parameter."
+        )
+
+    # Identical sequences need no computation
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
+    # Fetch the per-length sub-sequence sets, built (and memoized) by
+    # `_subseq_buckets()`; the bucket cardinalities *with* duplicates,
+    # which the union term needs, follow directly from the sequence
+    # lengths
+    subseqs_x = _subseq_buckets(tuple(seq_x))
+    subseqs_y = _subseq_buckets(tuple(seq_y))
 
     # From the longest subseq, which is the length of the longest sequence,
-    # collect all subsequences of that given length in both sets, compute the
+    # take the sub-sequences of that given length in both sets, compute the
     # Jaccard index, correct it by length of the subsequence (so that longer ones
     # will score higher) and update the internal results before returning.
-    # TODO: collect beforehand in a list, so we don´t repeat the comprehension
-    # TODO: convert to tuple beforehand as well?
+    len_x = len(seq_x)
+    len_y = len(seq_y)
     jaccard_scores = []
-    max_length = max([len(seq_x), len(seq_y)])
+    max_length = max([len_x, len_y])
     for length in range(max_length, 0, -1):
-        l_subseq1 = [tuple(ss) for ss in subseqs1 if len(ss) == length]
-        l_subseq2 = [tuple(ss) for ss in subseqs2 if len(ss) == length]
-
-        intersection = len(set(l_subseq1).intersection(l_subseq2))
-        union = len(l_subseq1) + len(l_subseq2) - intersection
+        set_x = subseqs_x.get(length)
+        set_y = subseqs_y.get(length)
+        if set_x and set_y:
+            intersection = len(set_x.intersection(set_y))
+        else:
+            intersection = 0
+
+        union = (
+            max(len_x - length + 1, 0) + max(len_y - length + 1, 0) - intersection
+        )
         jaccard_scores.append((float(intersection) / union) * length)
 
     # Compute the denominator, as the highest possible value
     den = (max_length * (max_length + 1)) / 2.0
 
-    if normal:
-        logging.warning(
-            "Subseq-Jaccard distance is always in [0..1] range, no need for `normal` parameter."
-        )
-
     return (1.0 - (sum(jaccard_scores) / den)) ** max_length
 
 
@@ -159,4 +265,8 @@ def sorensen_dist(
             "Sørensen–Dice distance is always in [0..1] range, no need for `normal` parameter."
         )
 
+    # Identical sequences need no computation
+    if _is_identical(seq_x, seq_y):
+        return 0.0
+
     return 1.0 - textdistance.Sorensen(external=False)(seq_x, seq_y)
@@ -49,3 +49,79 @@ def test_equivalent_string_long():
     assert len(eq_x) == 1000
     assert len(eq_y) == 2000
     assert len(set(eq_x + eq_y)) == 2500
+
+
+@pytest.mark.parametrize(
+    "seq_x,seq_y",
+    [
+        ["kitten", "sitting"],
+        ["test", "tset"],
+        ["Niall", "Neil"],
+        ["aluminum", "Catalan"],
+        [(1, 2, 3, 4, 5), (1, 2, 4, 3, 6, 7)],
+    ],
+)
+def test_levenshtein_diagonal(seq_x, seq_y):
+    """
+    Test the anti-diagonal Levenshtein kernel against the dispatch path.
+
+    The kernel is kept as a vectorized reference rather than being on
+    the dispatch path; this keeps it exercised by checking that it
+    agrees with `_levenshtein_core()`.
+    """
+
+    assert seqsim.common._levenshtein_diagonal(
+        seq_x, seq_y
+    ) == seqsim.common._levenshtein_core(seq_x, seq_y)
+
+
+@pytest.mark.parametrize(
+    "seq_x,seq_y",
+    [
+        ["kitten", "sitting"],
+        ["test", "tset"],
+        ["Niall", "Neil"],
+        ["aluminum", "Catalan"],
+        [(1, 2, 3, 4, 5), (1, 2, 4, 3, 6, 7)],
+    ],
+)
+def test_wagner_fischer_engines(seq_x, seq_y):
+    """
+    Test the generic Wagner-Fischer engines against the inlined kernels.
+
+    The dispatch path of the library runs through specialized kernels,
+    but the full-matrix and windowed engines remain the plug-in contract
+    for custom cost functions; this keeps them exercised by checking
+    that, fed the bulk-delete and stemmatological costs, they agree with
+    the kernels that inlined those costs.
+    """
+
+    max_del_len = 3
+    bulk_costs = seqsim.edit._bulk_delete_costs_factory(max_del_len)
+    first_column = seqsim.edit._bulk_delete_first_column(len(seq_x), max_del_len)
+    expected = seqsim.edit._bulk_delete_core(seq_x, seq_y, max_del_len)
+
+    full = seqsim.common._wagner_fischer(
+        seq_x,
+        seq_y,
+        bulk_costs,
+        seqsim.edit._bulk_delete_initial_matrix(seq_x, seq_y, max_del_len),
+    )
+    windowed = seqsim.common._wagner_fischer_windowed(
+        seq_x, seq_y, bulk_costs, first_column, max_del_len
+    )
+    assert full == pytest.approx(expected)
+    assert windowed == pytest.approx(expected)
+
+    stem_costs = seqsim.edit._stemmatological_costs_factory(
+        max_del_len, 20.0, 20.0, length=len(seq_x)
+    )
+    first_column = seqsim.edit._stemmatological_first_column(
+        len(seq_x), max_del_len, 20.0, 20.0
+    )
+    expected = seqsim.edit._stemmatological_core(seq_x, seq_y, max_del_len, 20.0, 20.0)
+
+    windowed = seqsim.common._wagner_fischer_windowed(
+        seq_x, seq_y, stem_costs, first_column, max_del_len
+    )
+    assert windowed == pytest.approx(expected)
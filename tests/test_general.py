@@ -12,6 +12,7 @@ testing multiple sequences.
 """
 
 # Import Python standard libraries
+import numpy as np
 import pytest
 
 # Import the library being tested
@@ -70,3 +71,80 @@ def test_multiwise_distance(seq_x, seq_y, seq_z):
     for method in seqsim.METHODS:
         assert seqsim.distance([seq_x, seq_y, seq_z], method=method) >= 0
         assert seqsim.distance([seq_x, seq_y, seq_z], method=method, normal=True) >= 0
+
+
+def test_numpy_sequences():
+    """
+    Test the methods accepting numpy arrays with array input.
+
+    Numpy arrays do not collapse `==` to a single truth value, so the
+    identity short-circuits of the public methods must go through an
+    array-safe comparison; this exercises the methods that support
+    array input with both differing and equal (but distinct) arrays.
+    """
+
+    seq_x = np.array([1, 2, 3, 4])
+    seq_y = np.array([1, 2, 4, 4])
+    methods = [
+        seqsim.edit.levenshtein_dist,
+        seqsim.edit.levdamerau_dist,
+        seqsim.edit.fragile_ends_simil,
+        seqsim.edit.stemmatological_simil,
+        seqsim.edit.bulk_delete_dist,
+        seqsim.token.jaccard_dist,
+    ]
+    for method in methods:
+        assert method(seq_x, seq_y) > 0
+        assert method(seq_x, seq_x) == 0.0
+        assert method(seq_x, seq_x.copy()) == 0.0
+
+    assert seqsim.edit.levenshtein_dist(seq_x, seq_y) == 1
+
+
+def test_distance_matrix():
+    """
+    Test the pairwise matrix wrapper for all methods.
+    """
+
+    seqs = ["test", "tset", "testtest", "Niall"]
+    for method in seqsim.METHODS:
+        matrix = seqsim.distance_matrix(seqs, method=method)
+        assert matrix.shape == (len(seqs), len(seqs))
+        for idx_x in range(len(seqs)):
+            for idx_y in range(len(seqs)):
+                assert matrix[idx_x, idx_y] == matrix[idx_y, idx_x]
+                if idx_x < idx_y:
+                    assert matrix[idx_x, idx_y] == pytest.approx(
+                        seqsim.METHODS[method](seqs[idx_x], seqs[idx_y])
+                    )
+
+
+def test_distance_matrix_parallel():
+    """
+    Test the parallel evaluation of the matrix wrapper.
+    """
+
+    seqs = ["test", "tset", "testtest", "Niall"]
+    serial = seqsim.distance_matrix(seqs, method="levenshtein")
+    parallel = seqsim.distance_matrix(seqs, method="levenshtein", workers=2)
+    assert (serial == parallel).all()
+
+
+def test_distance_matrix_threshold():
+    """
+    Test the triangle-inequality pruning of the matrix wrapper.
+    """
+
+    seqs = ["test", "tset", "testtest", "Niall", "Neil", "aluminum"]
+    threshold = 3
+    exact = seqsim.distance_matrix(seqs, method="levenshtein")
+    pruned = seqsim.distance_matrix(seqs, method="levenshtein", threshold=threshold)
+
+    # Scores within the threshold must be exact; everything else must
+    # be correctly reported as above the threshold
+    for idx_x in range(len(seqs)):
+        for idx_y in range(len(seqs)):
+            if exact[idx_x, idx_y] <= threshold:
+                assert pruned[idx_x, idx_y] == exact[idx_x, idx_y]
+            else:
+                assert pruned[idx_x, idx_y] > threshold
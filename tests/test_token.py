@@ -36,6 +36,20 @@ def test_jaccard_distance(seq_x, seq_y, expected, tol):
     assert dist_xz <= (dist_xy + dist_yz)
 
 
+def test_jaccard_matrix():
+    seqs = ["kitten", "sitting", (1, 2, 3), ["a", "b", "c", "d"]]
+    matrix = token.jaccard_matrix(seqs)
+
+    # The matrix must agree with the pairwise calls, with zeros in the diagonal
+    assert matrix.shape == (len(seqs), len(seqs))
+    for i, seq_x in enumerate(seqs):
+        for j, seq_y in enumerate(seqs):
+            if i == j:
+                assert matrix[i, j] == 0.0
+            else:
+                assert matrix[i, j] == pytest.approx(token.jaccard_dist(seq_x, seq_y))
+
+
 @pytest.mark.parametrize(
     "seq_x,seq_y,expected,tol",
     [